@@ -10,26 +10,75 @@ Sources (tried in order):
   4. Yahoo Finance ^TNX / ^IRX — Fallback for interest rates
   5. Built-in sample data — When all APIs are unreachable
 
+Live Yahoo Finance results are cached on disk under .cache/ (one JSON file per
+ticker and section) so repeated runs skip the network until the entry expires.
+
 Usage:
   from data_fetcher import fetch_all
   data = fetch_all("AAPL")
   data = fetch_all("MSFT", alpha_vantage_key="YOUR_KEY")
+  data = fetch_all("AAPL", force_refresh=True)   # bypass the disk cache
 """
 
+import importlib.util
+import json
+import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-try:
-    import yfinance as yf
-    HAS_YFINANCE = True
-except ImportError:
-    HAS_YFINANCE = False
+# yfinance (which drags in pandas, curl_cffi, ...), pandas and requests are
+# only imported on first use, so the sample-data path starts up fast
+HAS_YFINANCE = importlib.util.find_spec("yfinance") is not None
+HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+yf = None
+_EMPTY_DF = None
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _yf():
+    """The yfinance module, imported on first call."""
+    global yf
+    if yf is None:
+        import yfinance
+        yf = yfinance
+    return yf
+
 
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
+def _empty_df():
+    """Shared empty DataFrame used when a statement is missing (read-only)."""
+    global _EMPTY_DF
+    if _EMPTY_DF is None:
+        import pandas as pd
+        _EMPTY_DF = pd.DataFrame()
+    return _EMPTY_DF
+
+
+def _session():
+    """
+    One pooled session for all HTTP APIs so repeat calls to the same host
+    reuse the TCP/TLS connection instead of re-handshaking.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Retry transient 429/5xx inside urllib3 instead of dropping
+            # straight to the next data source
+            retry = Retry(total=3, backoff_factor=0.2,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=["GET"])
+            adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=10)
+            _SESSION = requests.Session()
+            _SESSION.mount("https://", adapter)
+    return _SESSION
 
 
 # ============================================================================
@@ -346,17 +395,83 @@ GENERIC_SAMPLE = {
 # LIVE DATA FETCHERS
 # ============================================================================
 
-def _safe_row(df, labels: list, default=0) -> list:
-    """Try each label in *labels* until one is found in df.index."""
-    for label in labels:
-        if label in df.index:
-            return df.loc[label].tolist()
+def _clean(values, n=None):
+    """First *n* years of a statement row as a float64 array, with missing values (None/NaN) as 0."""
+    import numpy as np
+    arr = np.asarray(values[:n], dtype=np.float64)
+    return np.where(np.isnan(arr), 0.0, arr)
+
+
+def _reported_years(values) -> int:
+    """Number of years (most recent first) up to the oldest one with a reported, non-zero value."""
+    import numpy as np
+    arr = np.asarray(values, dtype=np.float64)
+    reported = np.flatnonzero(~np.isnan(arr) & (arr != 0))
+    return int(reported[-1]) + 1 if reported.size else 0
+
+
+def _row_map(df) -> dict:
+    """Map each df.index label (as str) to the label itself, for repeated lookups."""
+    return {str(label): label for label in df.index}
+
+
+def _safe_row(df, labels: list, default=0, row_map: dict = None) -> list:
+    """
+    Try each label in *labels* until one is found in df.index.
+    Pass row_map (from _row_map) when reading many rows from the same df.
+    """
+    if row_map is None:
+        for label in labels:
+            if label in df.index:
+                return df.loc[label].tolist()
+    else:
+        for label in labels:
+            hit = row_map.get(label)
+            if hit is not None:
+                return df.loc[hit].tolist()
     return [default] * (len(df.columns) if hasattr(df, "columns") else 4)
 
 
-def fetch_stock_data_live(ticker: str) -> dict:
-    tk = yf.Ticker(ticker)
-    info = tk.info
+def _get_ticker(symbol: str):
+    """
+    A fresh yf.Ticker for *symbol*.  Not memoized: a Ticker caches its
+    .info / .fast_info for life, which would outlast the disk cache TTLs in
+    a long-running process.  fetch_all() creates one per call and passes it
+    down so the fetchers in that call share it.
+    """
+    return _yf().Ticker(symbol)
+
+
+# quoteSummary modules holding every .info field fetch_stock_data_live reads
+_INFO_MODULES = ["price", "summaryDetail", "defaultKeyStatistics", "assetProfile"]
+
+
+def _targeted_info(tk) -> dict:
+    """
+    Fetch only _INFO_MODULES and merge them into one flat, .info-style dict.
+    yfinance has no public per-module call, so this goes through its
+    private quote scraper.  Returns {} (and the caller reads tk.info) when
+    that API is missing or has changed shape; network errors propagate.
+    """
+    fetch = getattr(getattr(tk, "_quote", None), "_fetch", None)
+    if fetch is None:
+        return {}
+    try:
+        result = fetch(_INFO_MODULES)["quoteSummary"]["result"][0]
+    except (AttributeError, TypeError, KeyError, IndexError):
+        return {}
+    info = {}
+    for module in _INFO_MODULES:
+        info.update(result.get(module) or {})
+    return info
+
+
+def fetch_stock_data_live(ticker: str, tk=None) -> dict:
+    if tk is None:
+        tk = _get_ticker(ticker)
+    info = _targeted_info(tk)
+    if not info.get("shortName"):
+        info = tk.info
     fast = tk.fast_info
     current_price = getattr(fast, "last_price", None) or info.get("currentPrice") or info.get("regularMarketPrice", 0)
     market_cap = getattr(fast, "market_cap", None) or info.get("marketCap", 0)
@@ -380,81 +495,111 @@ def fetch_stock_data_live(ticker: str) -> dict:
     }
 
 
-def fetch_financials_live(ticker: str) -> dict:
-    tk = yf.Ticker(ticker)
-    inc = tk.income_stmt or __import__("pandas").DataFrame()
-    bs = tk.balance_sheet or __import__("pandas").DataFrame()
-    cf = tk.cashflow or __import__("pandas").DataFrame()
-
-    def _years(df):
+def fetch_financials_live(ticker: str, tk=None, concurrent: bool = True) -> dict:
+    """
+    Annual statements from Yahoo Finance.  *concurrent* fetches the three
+    statements on their own thread pool; fetch_all_batch() turns it off
+    because it already runs one ticker per worker.
+    """
+    if tk is None:
+        tk = _get_ticker(ticker)
+    statements = ["income_stmt", "balance_sheet", "cashflow"]
+    # The three statements are independent HTTP requests — fetch them concurrently
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            frames = list(pool.map(lambda attr: getattr(tk, attr), statements))
+    else:
+        frames = [getattr(tk, attr) for attr in statements]
+    inc, bs, cf = [df if df is not None else _empty_df() for df in frames]
+    # Yahoo answers a rate limit (or a ticker with no filings) with empty
+    # frames; raise so fetch_all() moves on to the fallbacks
+    for attr, df in zip(statements, (inc, bs, cf)):
         if df.empty:
-            return []
-        return [str(c.year) if hasattr(c, "year") else str(c) for c in df.columns]
-
-    years = _years(inc) or _years(bs) or _years(cf) or ["2024", "2023", "2022", "2021"]
-
-    revenue = _safe_row(inc, ["Total Revenue", "Revenue", "Operating Revenue"])
-    cost_of_revenue = _safe_row(inc, ["Cost Of Revenue", "Cost of Revenue"])
-    gross_profit = _safe_row(inc, ["Gross Profit", "GrossProfit"])
-    operating_income = _safe_row(inc, ["Operating Income", "OperatingIncome", "EBIT"])
-    ebitda = _safe_row(inc, ["EBITDA", "Ebitda", "Normalized EBITDA"])
-    net_income = _safe_row(inc, ["Net Income", "NetIncome", "Net Income Common Stockholders"])
-    tax_provision = _safe_row(inc, ["Tax Provision", "TaxProvision", "Income Tax Expense"])
-    interest_expense = _safe_row(inc, ["Interest Expense", "InterestExpense", "Interest Expense Non Operating"])
-    depreciation_in_inc = _safe_row(inc, ["Reconciled Depreciation", "Depreciation And Amortization In Income Statement"])
-
-    total_assets = _safe_row(bs, ["Total Assets", "TotalAssets"])
-    total_liabilities = _safe_row(bs, ["Total Liabilities Net Minority Interest", "Total Liabilities"])
-    total_equity = _safe_row(bs, ["Stockholders Equity", "Total Equity Gross Minority Interest"])
-    total_debt = _safe_row(bs, ["Total Debt", "TotalDebt", "Long Term Debt And Capital Lease Obligation"])
-    cash = _safe_row(bs, ["Cash And Cash Equivalents", "Cash Cash Equivalents And Short Term Investments"])
-    current_assets = _safe_row(bs, ["Current Assets", "CurrentAssets", "Total Current Assets"])
-    current_liabilities = _safe_row(bs, ["Current Liabilities", "CurrentLiabilities", "Total Current Liabilities"])
-
-    operating_cf = _safe_row(cf, ["Operating Cash Flow", "OperatingCashFlow", "Cash Flow From Continuing Operating Activities"])
-    capex = _safe_row(cf, ["Capital Expenditure", "CapitalExpenditure"])
-    depreciation_cf = _safe_row(cf, ["Depreciation And Amortization", "DepreciationAndAmortization"])
-    change_in_wc = _safe_row(cf, ["Change In Working Capital", "ChangeInWorkingCapital"])
-
-    fcf = [float(o or 0) + float(c or 0) for o, c in zip(operating_cf, capex)]
-
-    dep = depreciation_cf if any(v for v in depreciation_cf) else depreciation_in_inc
+            raise ValueError(f"no {attr} data for {ticker}")
+
+    years = [str(c.year) if hasattr(c, "year") else str(c) for c in inc.columns]
+
+    # One label map per statement; each row below is then a few dict probes
+    def _rows(df):
+        row_map = _row_map(df)
+        return lambda labels: _safe_row(df, labels, row_map=row_map)
+
+    inc_row, bs_row, cf_row = _rows(inc), _rows(bs), _rows(cf)
+
+    revenue = inc_row(["Total Revenue", "Revenue", "Operating Revenue"])
+    cost_of_revenue = inc_row(["Cost Of Revenue", "Cost of Revenue"])
+    gross_profit = inc_row(["Gross Profit", "GrossProfit"])
+    operating_income = inc_row(["Operating Income", "OperatingIncome", "EBIT"])
+    ebitda = inc_row(["EBITDA", "Ebitda", "Normalized EBITDA"])
+    net_income = inc_row(["Net Income", "NetIncome", "Net Income Common Stockholders"])
+    tax_provision = inc_row(["Tax Provision", "TaxProvision", "Income Tax Expense"])
+    interest_expense = inc_row(["Interest Expense", "InterestExpense", "Interest Expense Non Operating"])
+    depreciation_in_inc = inc_row(["Reconciled Depreciation", "Depreciation And Amortization In Income Statement"])
+
+    total_assets = bs_row(["Total Assets", "TotalAssets"])
+    total_liabilities = bs_row(["Total Liabilities Net Minority Interest", "Total Liabilities"])
+    total_equity = bs_row(["Stockholders Equity", "Total Equity Gross Minority Interest"])
+    total_debt = bs_row(["Total Debt", "TotalDebt", "Long Term Debt And Capital Lease Obligation"])
+    cash = bs_row(["Cash And Cash Equivalents", "Cash Cash Equivalents And Short Term Investments"])
+    current_assets = bs_row(["Current Assets", "CurrentAssets", "Total Current Assets"])
+    current_liabilities = bs_row(["Current Liabilities", "CurrentLiabilities", "Total Current Liabilities"])
+
+    operating_cf = cf_row(["Operating Cash Flow", "OperatingCashFlow", "Cash Flow From Continuing Operating Activities"])
+    capex = cf_row(["Capital Expenditure", "CapitalExpenditure"])
+    depreciation_cf = cf_row(["Depreciation And Amortization", "DepreciationAndAmortization"])
+    change_in_wc = cf_row(["Change In Working Capital", "ChangeInWorkingCapital"])
+
+    # yfinance pads the oldest column with NaN when that year is only partly
+    # reported.  Drop such years instead of zero-filling them, which the
+    # engine would read as a real year of zero revenue
+    n_years = _reported_years(revenue)
+    if not n_years:
+        raise ValueError(f"no revenue reported for {ticker}")
+    years = years[:n_years]
+    revenue = _clean(revenue, n_years)
+
+    operating_cf, capex = _clean(operating_cf, n_years), _clean(capex, n_years)
+    n = min(len(operating_cf), len(capex))
+    fcf = (operating_cf[:n] + capex[:n]).tolist()
+
+    depreciation_cf = _clean(depreciation_cf, n_years)
+    dep = depreciation_cf if depreciation_cf.any() else depreciation_in_inc
 
     return {
         "years": years,
-        "revenue": [float(v or 0) for v in revenue],
-        "cost_of_revenue": [float(v or 0) for v in cost_of_revenue],
-        "gross_profit": [float(v or 0) for v in gross_profit],
-        "operating_income": [float(v or 0) for v in operating_income],
-        "ebitda": [float(v or 0) for v in ebitda],
-        "net_income": [float(v or 0) for v in net_income],
-        "tax_provision": [float(v or 0) for v in tax_provision],
-        "interest_expense": [float(v or 0) for v in interest_expense],
-        "depreciation": [float(v or 0) for v in dep],
-        "total_assets": [float(v or 0) for v in total_assets],
-        "total_liabilities": [float(v or 0) for v in total_liabilities],
-        "total_equity": [float(v or 0) for v in total_equity],
-        "total_debt": [float(v or 0) for v in total_debt],
-        "cash": [float(v or 0) for v in cash],
-        "current_assets": [float(v or 0) for v in current_assets],
-        "current_liabilities": [float(v or 0) for v in current_liabilities],
-        "operating_cash_flow": [float(v or 0) for v in operating_cf],
-        "capex": [float(v or 0) for v in capex],
-        "depreciation_amortization": [float(v or 0) for v in depreciation_cf],
-        "change_in_working_capital": [float(v or 0) for v in change_in_wc],
+        "revenue": revenue.tolist(),
+        "cost_of_revenue": _clean(cost_of_revenue, n_years).tolist(),
+        "gross_profit": _clean(gross_profit, n_years).tolist(),
+        "operating_income": _clean(operating_income, n_years).tolist(),
+        "ebitda": _clean(ebitda, n_years).tolist(),
+        "net_income": _clean(net_income, n_years).tolist(),
+        "tax_provision": _clean(tax_provision, n_years).tolist(),
+        "interest_expense": _clean(interest_expense, n_years).tolist(),
+        "depreciation": _clean(dep, n_years).tolist(),
+        "total_assets": _clean(total_assets, n_years).tolist(),
+        "total_liabilities": _clean(total_liabilities, n_years).tolist(),
+        "total_equity": _clean(total_equity, n_years).tolist(),
+        "total_debt": _clean(total_debt, n_years).tolist(),
+        "cash": _clean(cash, n_years).tolist(),
+        "current_assets": _clean(current_assets, n_years).tolist(),
+        "current_liabilities": _clean(current_liabilities, n_years).tolist(),
+        "operating_cash_flow": operating_cf.tolist(),
+        "capex": capex.tolist(),
+        "depreciation_amortization": depreciation_cf.tolist(),
+        "change_in_working_capital": _clean(change_in_wc, n_years).tolist(),
         "free_cash_flow": fcf,
     }
 
 
 def fetch_stock_data_alphavantage(ticker: str, api_key: str) -> dict:
     base = "https://www.alphavantage.co/query"
-    resp = requests.get(base, params={
+    resp = _session().get(base, params={
         "function": "GLOBAL_QUOTE", "symbol": ticker, "apikey": api_key,
     }, timeout=15)
     gq = resp.json().get("Global Quote", {})
     price = float(gq.get("05. price", 0))
 
-    resp2 = requests.get(base, params={
+    resp2 = _session().get(base, params={
         "function": "OVERVIEW", "symbol": ticker, "apikey": api_key,
     }, timeout=15)
     ov = resp2.json()
@@ -483,13 +628,13 @@ def fetch_stock_data_alphavantage(ticker: str, api_key: str) -> dict:
 
 def fetch_financials_alphavantage(ticker: str, api_key: str) -> dict:
     base = "https://www.alphavantage.co/query"
-    inc_r = requests.get(base, params={
+    inc_r = _session().get(base, params={
         "function": "INCOME_STATEMENT", "symbol": ticker, "apikey": api_key,
     }, timeout=15).json()
-    bs_r = requests.get(base, params={
+    bs_r = _session().get(base, params={
         "function": "BALANCE_SHEET", "symbol": ticker, "apikey": api_key,
     }, timeout=15).json()
-    cf_r = requests.get(base, params={
+    cf_r = _session().get(base, params={
         "function": "CASH_FLOW", "symbol": ticker, "apikey": api_key,
     }, timeout=15).json()
 
@@ -542,7 +687,7 @@ def fetch_financials_alphavantage(ticker: str, api_key: str) -> dict:
         "net_income": net_income,
         "tax_provision": tax_provision,
         "interest_expense": interest_expense,
-        "depreciation": [float(v or 0) for v in dep],
+        "depreciation": _clean(dep).tolist(),
         "total_assets": total_assets,
         "total_liabilities": total_liabilities,
         "total_equity": total_equity,
@@ -558,45 +703,56 @@ def fetch_financials_alphavantage(ticker: str, api_key: str) -> dict:
     }
 
 
+def _fetch_fred_series(series: str, api_key: str):
+    """Latest non-missing observation of a FRED series as a decimal rate, or None."""
+    base = "https://api.stlouisfed.org/fred/series/observations"
+    resp = _session().get(base, params={
+        "series_id": series, "api_key": api_key,
+        "file_type": "json", "sort_order": "desc", "limit": 5,
+    }, timeout=10)
+    for obs in resp.json().get("observations", []):
+        if obs["value"] != ".":
+            return float(obs["value"]) / 100.0
+    return None
+
+
 def fetch_rates_live(fred_api_key: str = None) -> dict:
     risk_free = None
     treasury_2y = None
     fed_funds = None
+    # Stays "default" if every source fails and the placeholders below are used
+    rate_source = "default"
 
-    # Try FRED first
+    # Try FRED first — the three series are independent requests, run them concurrently
     if fred_api_key and HAS_REQUESTS:
-        base = "https://api.stlouisfed.org/fred/series/observations"
-        for series, target in [("DGS10", "rf"), ("DGS2", "t2"), ("FEDFUNDS", "ff")]:
-            try:
-                resp = requests.get(base, params={
-                    "series_id": series, "api_key": fred_api_key,
-                    "file_type": "json", "sort_order": "desc", "limit": 5,
-                }, timeout=10)
-                for obs in resp.json().get("observations", []):
-                    if obs["value"] != ".":
-                        val = float(obs["value"]) / 100.0
-                        if target == "rf":
-                            risk_free = val
-                        elif target == "t2":
-                            treasury_2y = val
-                        else:
-                            fed_funds = val
-                        break
-            except Exception:
-                pass
+        fred = {}
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {pool.submit(_fetch_fred_series, series, fred_api_key): series
+                       for series in ["DGS10", "DGS2", "FEDFUNDS"]}
+            for fut in as_completed(futures):
+                try:
+                    fred[futures[fut]] = fut.result()
+                except Exception:
+                    pass
+        risk_free = fred.get("DGS10")
+        treasury_2y = fred.get("DGS2")
+        fed_funds = fred.get("FEDFUNDS")
+        if risk_free is not None:
+            rate_source = "fred"
 
     # Fallback: Yahoo Finance ^TNX
     if risk_free is None and HAS_YFINANCE:
         try:
-            hist = yf.Ticker("^TNX").history(period="5d")
+            hist = _get_ticker("^TNX").history(period="5d")
             if not hist.empty:
                 risk_free = float(hist["Close"].iloc[-1]) / 100.0
+                rate_source = "yahoo"
         except Exception:
             pass
 
     if treasury_2y is None and HAS_YFINANCE:
         try:
-            hist = yf.Ticker("^IRX").history(period="5d")
+            hist = _get_ticker("^IRX").history(period="5d")
             if not hist.empty:
                 treasury_2y = float(hist["Close"].iloc[-1]) / 100.0
         except Exception:
@@ -608,16 +764,96 @@ def fetch_rates_live(fred_api_key: str = None) -> dict:
         "treasury_2y": treasury_2y or 0.042,
         "fed_funds_rate": fed_funds or (risk_free - 0.005 if risk_free else 0.04),
         "date_fetched": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "rate_source": rate_source,
     }
 
 
+# ============================================================================
+# DISK CACHE
+# ============================================================================
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# How long (seconds) each fetch_all() section stays fresh on disk
+CACHE_TTL = {
+    "stock": 60 * 60,               # price / market cap: 1 hour
+    "financials": 90 * 24 * 3600,   # annual statements: 90 days
+    "rates": 24 * 3600,             # treasury yields: 1 day
+}
+
+
+class FileCache:
+    """JSON file cache: each key is stored as {ts, data} in <directory>/<key>.json."""
+
+    def __init__(self, directory: str = CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str, ttl: float):
+        """Return the data stored under *key* if younger than *ttl* seconds, else None."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("ts", 0) >= ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data) -> None:
+        """Store *data* under *key*. Failures are ignored — the cache is best-effort."""
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "data": data}, f)
+            os.replace(path + ".tmp", path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+
+_CACHE = FileCache()
+
+
+# Guards on what gets written to disk: a section failing its check is still
+# returned to the caller but not stored.  Rates that fell back to the
+# hard-coded defaults are used for this run only, and rates are kept only
+# under the key of the source they actually came from.  (Empty statements
+# never get this far; fetch_financials_live raises on them.)
+CACHE_VALID = {
+    "stock": lambda key, data: True,
+    "financials": lambda key, data: bool(data.get("revenue")),
+    "rates": lambda key, data: key == f"rates_{data.get('rate_source')}",
+}
+
+
+def _rates_cache_key(fred_api_key: str = None) -> str:
+    """Separate cache entries for FRED- and Yahoo-sourced rates."""
+    return "rates_fred" if fred_api_key else "rates_yahoo"
+
+
+def _cached(key: str, section: str, fetch, force_refresh: bool = False):
+    """Return *key* from the disk cache, calling *fetch()* and storing a valid result on a miss."""
+    if not force_refresh:
+        data = _CACHE.get(key, CACHE_TTL[section])
+        if data is not None:
+            return data
+    data = fetch()
+    if CACHE_VALID[section](key, data):
+        _CACHE.set(key, data)
+    return data
+
+
 # ============================================================================
 # PUBLIC INTERFACE
 # ============================================================================
 
 def fetch_all(ticker: str, fred_api_key: str = None,
               alpha_vantage_key: str = None,
-              force_sample: bool = False) -> dict:
+              force_sample: bool = False,
+              force_refresh: bool = False) -> dict:
     """
     Fetch all data needed for the DCF model.  Returns:
       { "stock": {...}, "financials": {...}, "rates": {...}, "source": "live"|"alphavantage"|"sample" }
@@ -626,18 +862,35 @@ def fetch_all(ticker: str, fred_api_key: str = None,
       1. Yahoo Finance (yfinance) — no API key needed
       2. Alpha Vantage — requires free API key (get at alphavantage.co)
       3. Sample data — built-in fallback for offline use
+
+    Yahoo Finance results are served from the disk cache while fresh (see
+    CACHE_TTL); pass force_refresh=True to re-download everything.
     """
     ticker = ticker.upper().strip()
 
     if not force_sample and HAS_YFINANCE:
         try:
-            stock = fetch_stock_data_live(ticker)
-            financials = fetch_financials_live(ticker)
-            rates = fetch_rates_live(fred_api_key)
+            tk = _get_ticker(ticker)
+            # Stock, financials and rates share no state — fetch them concurrently
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                stock_f = pool.submit(_cached, f"{ticker}_stock", "stock",
+                                      lambda: fetch_stock_data_live(ticker, tk), force_refresh)
+                fin_f = pool.submit(_cached, f"{ticker}_financials", "financials",
+                                    lambda: fetch_financials_live(ticker, tk), force_refresh)
+                rates_f = pool.submit(_cached, _rates_cache_key(fred_api_key), "rates",
+                                      lambda: fetch_rates_live(fred_api_key), force_refresh)
+                stock, financials, rates = stock_f.result(), fin_f.result(), rates_f.result()
             return {"stock": stock, "financials": financials, "rates": rates, "source": "live"}
         except Exception as e:
             print(f"[data_fetcher] Yahoo Finance fetch failed ({e}), trying fallbacks...")
 
+    return _fetch_fallbacks(ticker, fred_api_key, alpha_vantage_key, force_sample)
+
+
+def _fetch_fallbacks(ticker: str, fred_api_key: str = None,
+                     alpha_vantage_key: str = None,
+                     force_sample: bool = False) -> dict:
+    """fetch_all() after the Yahoo Finance leg: Alpha Vantage, then sample data."""
     if not force_sample and alpha_vantage_key and HAS_REQUESTS:
         try:
             stock = fetch_stock_data_alphavantage(ticker, alpha_vantage_key)
@@ -651,16 +904,60 @@ def fetch_all(ticker: str, fred_api_key: str = None,
         print("[data_fetcher] yfinance not installed. Install with: pip install yfinance")
 
     # Fallback to sample data
-    if ticker in SAMPLE_DATA:
-        data = SAMPLE_DATA[ticker]
-    else:
-        data = GENERIC_SAMPLE.copy()
-        data["stock"] = {**GENERIC_SAMPLE["stock"], "ticker": ticker, "company_name": f"{ticker} (Sample)"}
+    # Sample sections are shared, not copied — the engine only reads them
+    data = SAMPLE_DATA.get(ticker, GENERIC_SAMPLE)
+    stock = data["stock"]
+    if data is GENERIC_SAMPLE:
+        stock = {**stock, "ticker": ticker, "company_name": f"{ticker} (Sample)"}
 
-    return {"stock": data["stock"], "financials": data["financials"],
+    return {"stock": stock, "financials": data["financials"],
             "rates": data["rates"], "source": "sample"}
 
 
+def fetch_all_batch(tickers: list, fred_api_key: str = None,
+                    alpha_vantage_key: str = None,
+                    force_sample: bool = False,
+                    force_refresh: bool = False) -> dict:
+    """
+    Fetch DCF inputs for several tickers at once.  Returns
+      { ticker: <fetch_all result>, ... }
+
+    Rates are fetched once and shared by every entry.  Yahoo Finance
+    lookups go through one yf.Tickers batch and run on a thread pool, one
+    ticker per worker with its statements fetched serially; any ticker
+    whose live fetch fails goes straight to the non-Yahoo fallbacks.
+    """
+    symbols = list(dict.fromkeys(t.upper().strip() for t in tickers))
+
+    if force_sample or not HAS_YFINANCE:
+        return {t: fetch_all(t, fred_api_key, alpha_vantage_key, force_sample=force_sample)
+                for t in symbols}
+
+    rates = _cached(_rates_cache_key(fred_api_key), "rates", lambda: fetch_rates_live(fred_api_key), force_refresh)
+    try:
+        batch = _yf().Tickers(" ".join(symbols)).tickers
+    except Exception as e:
+        # Each ticker then builds its own Ticker (or falls back) in _fetch_one
+        print(f"[data_fetcher] Yahoo Finance batch lookup failed ({e}), fetching tickers one by one...")
+        batch = {}
+
+    def _fetch_one(ticker):
+        try:
+            tk = batch.get(ticker) or _get_ticker(ticker)
+            stock = _cached(f"{ticker}_stock", "stock",
+                            lambda: fetch_stock_data_live(ticker, tk), force_refresh)
+            financials = _cached(f"{ticker}_financials", "financials",
+                                 lambda: fetch_financials_live(ticker, tk, concurrent=False),
+                                 force_refresh)
+            return {"stock": stock, "financials": financials, "rates": rates, "source": "live"}
+        except Exception as e:
+            print(f"[data_fetcher] Yahoo Finance fetch failed for {ticker} ({e}), trying fallbacks...")
+            return _fetch_fallbacks(ticker, fred_api_key, alpha_vantage_key)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return dict(zip(symbols, pool.map(_fetch_one, symbols)))
+
+
 # ============================================================================
 if __name__ == "__main__":
     t = sys.argv[1] if len(sys.argv) > 1 else "AAPL"
@@ -14,8 +14,23 @@ Each scenario models year-by-year interest rate trajectories so the WACC
 changes dynamically rather than using a single static adjustment.
 """
 
+import functools
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 
 # ============================================================================
@@ -101,12 +116,53 @@ SCENARIOS = {
 }
 
 
+# ============================================================================
+# FINANCIALS LAYOUT
+# ============================================================================
+
+@dataclass(frozen=True, eq=False)
+class FinancialsSOA:
+    """
+    The historical series the engine reads, as float64 arrays (most recent
+    year first).  Built once per run so every scenario shares the same
+    contiguous arrays instead of re-reading the fetcher's lists.
+    """
+    revenue: np.ndarray
+    operating_income: np.ndarray
+    net_income: np.ndarray
+    tax_provision: np.ndarray
+    interest_expense: np.ndarray
+    depreciation: np.ndarray
+    capex: np.ndarray
+    free_cash_flow: np.ndarray
+    total_debt: np.ndarray
+    cash: np.ndarray
+
+
+def financials_to_soa(financials: Union[dict, FinancialsSOA]) -> FinancialsSOA:
+    """Convert a data_fetcher financials dict to a FinancialsSOA (no-op if already one)."""
+    if isinstance(financials, FinancialsSOA):
+        return financials
+    return FinancialsSOA(**{
+        name: np.asarray(financials[name], dtype=np.float64)
+        for name in FinancialsSOA.__dataclass_fields__
+    })
+
+
 # ============================================================================
 # WACC CALCULATION
 # ============================================================================
 
-def compute_wacc(stock: dict, financials: dict, rates: dict,
-                 equity_risk_premium: float = 0.055) -> dict:
+def _effective_tax_rate(fin: FinancialsSOA) -> float:
+    """Latest-year tax provision / pre-tax income, or 21% when that is undefined."""
+    tax_prov = abs(float(fin.tax_provision[0])) if fin.tax_provision[0] else 0
+    pretax = abs(float(fin.net_income[0])) + tax_prov
+    return tax_prov / pretax if pretax > 0 else 0.21
+
+
+def compute_wacc(stock: dict, financials: Union[dict, FinancialsSOA], rates: dict,
+                 equity_risk_premium: float = 0.055,
+                 tax_rate: float = None) -> dict:
     """
     Compute Weighted Average Cost of Capital.
 
@@ -116,6 +172,7 @@ def compute_wacc(stock: dict, financials: dict, rates: dict,
       Re = Rf + Beta * ERP           (CAPM)
       Rd = Interest Expense / Debt   (implied cost of debt)
     """
+    fin = financials_to_soa(financials)
     rf = rates["risk_free_rate"]
     beta = stock.get("beta", 1.0) or 1.0
 
@@ -123,18 +180,17 @@ def compute_wacc(stock: dict, financials: dict, rates: dict,
     cost_of_equity = rf + beta * equity_risk_premium
 
     # Cost of debt (implied)
-    debt = financials["total_debt"][0] if financials["total_debt"][0] else 1
-    interest = abs(financials["interest_expense"][0]) if financials["interest_expense"][0] else 0
+    debt = float(fin.total_debt[0]) if fin.total_debt[0] else 1
+    interest = abs(float(fin.interest_expense[0])) if fin.interest_expense[0] else 0
     cost_of_debt = interest / debt if debt > 0 else rf
 
-    # Tax rate (effective)
-    tax_prov = abs(financials["tax_provision"][0]) if financials["tax_provision"][0] else 0
-    pretax_income = (abs(financials["net_income"][0]) + tax_prov) if financials["net_income"][0] else 1
-    tax_rate = tax_prov / pretax_income if pretax_income > 0 else 0.21
+    # Tax rate (effective) — run_all_scenarios passes the one from the metrics
+    if tax_rate is None:
+        tax_rate = _effective_tax_rate(fin)
 
     # Capital structure
     equity_value = stock.get("market_cap", 0) or (stock["current_price"] * stock["shares_outstanding"])
-    debt_value = financials["total_debt"][0]
+    debt_value = float(fin.total_debt[0])
     total_value = equity_value + debt_value
 
     weight_equity = equity_value / total_value if total_value > 0 else 0.7
@@ -161,47 +217,60 @@ def compute_wacc(stock: dict, financials: dict, rates: dict,
 # FCF PROJECTION
 # ============================================================================
 
-def compute_historical_metrics(financials: dict) -> dict:
+def _safe_div(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Element-wise num / den, with 0 wherever den is 0."""
+    return np.divide(num, den, out=np.zeros_like(num), where=den != 0)
+
+
+def compute_historical_metrics(financials: Union[dict, FinancialsSOA]) -> dict:
     """Derive growth rates, margins, and ratios from historical data."""
-    rev = financials["revenue"]
-    fcf = financials["free_cash_flow"]
-    oi = financials["operating_income"]
-    ni = financials["net_income"]
-    capex = financials["capex"]
-    da = financials["depreciation"]
+    fin = financials_to_soa(financials)
+    rev = fin.revenue
+    n = len(rev)
+
+    fcf = fin.free_cash_flow[:n]
+    oi = fin.operating_income[:n]
+    ni = fin.net_income[:n]
+    capex = fin.capex[:n]
+    da = fin.depreciation[:n]
 
     # Revenue growth rates (YoY, most recent first so [0] vs [1] is latest)
-    rev_growths = []
-    for i in range(len(rev) - 1):
-        if rev[i + 1] and rev[i + 1] != 0:
-            rev_growths.append((rev[i] - rev[i + 1]) / abs(rev[i + 1]))
-        else:
-            rev_growths.append(0)
+    prior = rev[1:]
+    rev_growths = _safe_div(rev[:-1] - prior, np.abs(prior))
 
     # Margins
-    op_margins = [oi[i] / rev[i] if rev[i] else 0 for i in range(len(rev))]
-    net_margins = [ni[i] / rev[i] if rev[i] else 0 for i in range(len(rev))]
-    fcf_margins = [fcf[i] / rev[i] if rev[i] else 0 for i in range(len(rev))]
+    op_margins = _safe_div(oi, rev)
+    net_margins = _safe_div(ni, rev)
+    fcf_margins = _safe_div(fcf, rev)
 
     # Capex as % of revenue
-    capex_pcts = [abs(capex[i]) / rev[i] if rev[i] else 0 for i in range(len(rev))]
+    capex_pcts = _safe_div(np.abs(capex), rev)
 
     # D&A as % of revenue
-    da_pcts = [abs(da[i]) / rev[i] if rev[i] else 0 for i in range(len(rev))]
-
-    avg_rev_growth = sum(rev_growths) / len(rev_growths) if rev_growths else 0.05
-    avg_op_margin = sum(op_margins) / len(op_margins) if op_margins else 0.15
-    avg_fcf_margin = sum(fcf_margins) / len(fcf_margins) if fcf_margins else 0.10
-    avg_capex_pct = sum(capex_pcts) / len(capex_pcts) if capex_pcts else 0.03
-    avg_da_pct = sum(da_pcts) / len(da_pcts) if da_pcts else 0.03
+    da_pcts = _safe_div(np.abs(da), rev)
+
+    # A zero-revenue year is a missing filing, not a real zero: its ratios
+    # are left in the per-year lists but kept out of the averages
+    reported = rev != 0
+    grew = reported[:-1] & reported[1:]
+    rev_growths_avg = rev_growths[grew]
+    op_margins_avg, fcf_margins_avg = op_margins[reported], fcf_margins[reported]
+    capex_pcts_avg, da_pcts_avg = capex_pcts[reported], da_pcts[reported]
+
+    avg_rev_growth = float(rev_growths_avg.mean()) if rev_growths_avg.size else 0.05
+    avg_op_margin = float(op_margins_avg.mean()) if op_margins_avg.size else 0.15
+    avg_fcf_margin = float(fcf_margins_avg.mean()) if fcf_margins_avg.size else 0.10
+    avg_capex_pct = float(capex_pcts_avg.mean()) if capex_pcts_avg.size else 0.03
+    avg_da_pct = float(da_pcts_avg.mean()) if da_pcts_avg.size else 0.03
 
     return {
-        "revenue_growths": rev_growths,
-        "operating_margins": op_margins,
-        "net_margins": net_margins,
-        "fcf_margins": fcf_margins,
-        "capex_pcts": capex_pcts,
-        "da_pcts": da_pcts,
+        "tax_rate": _effective_tax_rate(fin),
+        "revenue_growths": rev_growths.tolist(),
+        "operating_margins": op_margins.tolist(),
+        "net_margins": net_margins.tolist(),
+        "fcf_margins": fcf_margins.tolist(),
+        "capex_pcts": capex_pcts.tolist(),
+        "da_pcts": da_pcts.tolist(),
         "avg_revenue_growth": avg_rev_growth,
         "avg_operating_margin": avg_op_margin,
         "avg_fcf_margin": avg_fcf_margin,
@@ -210,7 +279,76 @@ def compute_historical_metrics(financials: dict) -> dict:
     }
 
 
-def project_fcf(financials: dict, metrics: dict, scenario: Scenario,
+def _pad_path(path: list, n: int, default: float) -> list:
+    """Return the first n entries of a scenario path, repeating the last one as needed."""
+    path = list(path or [default])[:n]
+    return path + path[-1:] * (n - len(path))
+
+
+def _project_batch(fin: FinancialsSOA, metrics: dict, scenarios: list,
+                   projection_years: int) -> dict:
+    """
+    Project FCF for several scenarios in one pass.  Every array in the
+    result has shape (len(scenarios), projection_years), one row per
+    scenario, so all of them share a single set of NumPy calls.
+    """
+    n = projection_years
+    base_rev = float(fin.revenue[0])
+    tax_rate = metrics["tax_rate"]
+
+    adj = np.array([[s.revenue_growth_adj, s.margin_adj] for s in scenarios], dtype=np.float64)
+    adj_growth = np.maximum(metrics["avg_revenue_growth"] + adj[:, 0], -0.15)[:, None]
+    adj_margin = np.maximum(metrics["avg_operating_margin"] + adj[:, 1], 0.01)[:, None]
+
+    growth_traj = np.array([_pad_path(s.growth_trajectory, n, 1.0) for s in scenarios],
+                           dtype=np.float64).reshape(len(scenarios), n)
+    margin_traj = np.array([_pad_path(s.margin_trajectory, n, 0.0) for s in scenarios],
+                           dtype=np.float64).reshape(len(scenarios), n)
+
+    growth_rates = np.maximum(adj_growth * growth_traj, -0.15)
+    growth_rates = np.where(adj_growth > 0, np.maximum(growth_rates, 0.005), growth_rates)
+
+    margins = np.maximum(adj_margin + margin_traj, 0.01)
+
+    # Compound from base revenue in the same order as a year-by-year loop
+    start = np.full((len(scenarios), 1), base_rev)
+    revenue = np.cumprod(np.hstack([start, 1 + growth_rates]), axis=1)[:, 1:]
+    ebit = revenue * margins
+    nopat = ebit * (1 - tax_rate)
+    da = revenue * metrics["avg_da_pct"]
+    capex = revenue * metrics["avg_capex_pct"]
+
+    return {
+        "growth_rates": growth_rates,
+        "margins": margins,
+        "projected_revenue": revenue,
+        "projected_ebit": ebit,
+        "projected_nopat": nopat,
+        "projected_da": da,
+        "projected_capex": capex,
+        "projected_fcf": nopat + da - capex,
+    }
+
+
+def _projection_dict(scenario: Scenario, projection_years: int, tax_rate: float,
+                     batch: dict, i: int) -> dict:
+    """Row *i* of a _project_batch result in the project_fcf return format."""
+    return {
+        "scenario": scenario.name,
+        "projection_years": projection_years,
+        "growth_rates": batch["growth_rates"][i].tolist(),
+        "margins": batch["margins"][i].tolist(),
+        "tax_rate": tax_rate,
+        "projected_revenue": batch["projected_revenue"][i].tolist(),
+        "projected_ebit": batch["projected_ebit"][i].tolist(),
+        "projected_nopat": batch["projected_nopat"][i].tolist(),
+        "projected_da": batch["projected_da"][i].tolist(),
+        "projected_capex": batch["projected_capex"][i].tolist(),
+        "projected_fcf": batch["projected_fcf"][i].tolist(),
+    }
+
+
+def project_fcf(financials: Union[dict, FinancialsSOA], metrics: dict, scenario: Scenario,
                 projection_years: int = 5) -> dict:
     """
     Project Free Cash Flow for the next N years under a given scenario.
@@ -226,168 +364,245 @@ def project_fcf(financials: dict, metrics: dict, scenario: Scenario,
       4. Add back D&A, subtract CapEx
       5. Result = Unlevered Free Cash Flow
     """
-    base_rev = financials["revenue"][0]
-    base_growth = metrics["avg_revenue_growth"]
-    base_op_margin = metrics["avg_operating_margin"]
-    base_capex_pct = metrics["avg_capex_pct"]
-    base_da_pct = metrics["avg_da_pct"]
-
-    tax_prov = abs(financials["tax_provision"][0]) if financials["tax_provision"][0] else 0
-    pretax = abs(financials["net_income"][0]) + tax_prov
-    tax_rate = tax_prov / pretax if pretax > 0 else 0.21
-
-    adj_growth = max(base_growth + scenario.revenue_growth_adj, -0.15)
-    adj_margin = max(base_op_margin + scenario.margin_adj, 0.01)
-
-    growth_traj = scenario.growth_trajectory or [1.0] * projection_years
-    margin_traj = scenario.margin_trajectory or [0.0] * projection_years
-    while len(growth_traj) < projection_years:
-        growth_traj.append(growth_traj[-1] if growth_traj else 1.0)
-    while len(margin_traj) < projection_years:
-        margin_traj.append(margin_traj[-1] if margin_traj else 0.0)
-
-    projected_revenue = []
-    projected_ebit = []
-    projected_nopat = []
-    projected_da = []
-    projected_capex = []
-    projected_fcf = []
-    growth_rates = []
-    margins = []
-
-    cumulative_rev = base_rev
-    for yr in range(projection_years):
-        growth = adj_growth * growth_traj[yr]
-        growth = max(growth, -0.15)
-        if adj_growth > 0:
-            growth = max(growth, 0.005)
-
-        year_margin = max(adj_margin + margin_traj[yr], 0.01)
-
-        cumulative_rev = cumulative_rev * (1 + growth)
-        ebit = cumulative_rev * year_margin
-        nopat = ebit * (1 - tax_rate)
-        da = cumulative_rev * base_da_pct
-        capex = cumulative_rev * base_capex_pct
-        fcf = nopat + da - capex
-
-        projected_revenue.append(cumulative_rev)
-        projected_ebit.append(ebit)
-        projected_nopat.append(nopat)
-        projected_da.append(da)
-        projected_capex.append(capex)
-        projected_fcf.append(fcf)
-        growth_rates.append(growth)
-        margins.append(year_margin)
-
-    return {
-        "scenario": scenario.name,
-        "projection_years": projection_years,
-        "growth_rates": growth_rates,
-        "margins": margins,
-        "tax_rate": tax_rate,
-        "projected_revenue": projected_revenue,
-        "projected_ebit": projected_ebit,
-        "projected_nopat": projected_nopat,
-        "projected_da": projected_da,
-        "projected_capex": projected_capex,
-        "projected_fcf": projected_fcf,
-    }
+    fin = financials_to_soa(financials)
+    batch = _project_batch(fin, metrics, [scenario], projection_years)
+    return _projection_dict(scenario, projection_years, metrics["tax_rate"], batch, 0)
 
 
 # ============================================================================
 # DCF VALUATION
 # ============================================================================
 
-def compute_dcf(projection: dict, wacc_data: dict, scenario: Scenario,
-                stock: dict, financials: dict,
-                terminal_growth: float = 0.025) -> dict:
+@functools.lru_cache(maxsize=1024)
+def _cumulative_discount(yearly_waccs: tuple) -> np.ndarray:
     """
-    Compute enterprise value via DCF, then derive equity value per share.
+    Running product of (1 + WACC) along each WACC path (one tuple per
+    scenario).  Cached by the exact paths so repeats (sweeps, shared
+    scenarios) reuse it; the returned array is read-only because it is
+    shared between callers.
+    """
+    discount = np.cumprod(1 + np.asarray(yearly_waccs, dtype=np.float64), axis=-1)
+    discount.flags.writeable = False
+    return discount
 
-    Uses year-by-year WACC adjustments from the scenario's rate_path_bp
-    to model how changing interest rates affect the discount rate over time.
 
-    Terminal Value = FCF_n * (1 + g) / (WACC_terminal - g)   [Gordon Growth Model]
+def _dcf_batch(fcfs: np.ndarray, wacc_data: dict, scenarios: list, stock: dict,
+               fin: FinancialsSOA, terminal_growth: float) -> list:
+    """
+    Value several scenarios at once from an (S, N) array of projected FCFs.
+    Returns one compute_dcf-style dict per scenario, in order.
     """
     base_wacc = wacc_data["wacc"]
-    rate_path = scenario.rate_path_bp or [0] * len(projection["projected_fcf"])
-    while len(rate_path) < len(projection["projected_fcf"]):
-        rate_path.append(rate_path[-1] if rate_path else 0)
-
-    fcfs = projection["projected_fcf"]
-    n = len(fcfs)
+    n = fcfs.shape[1]
+    rate_paths = [_pad_path(s.rate_path_bp, n, 0) for s in scenarios]
 
     # Year-by-year WACC with cumulative rate path
-    yearly_waccs = []
-    cumulative_bp = 0
-    for i in range(n):
-        cumulative_bp += rate_path[i]
-        yr_wacc = max(base_wacc + cumulative_bp / 10000.0, 0.04)
-        yearly_waccs.append(yr_wacc)
+    cumulative_bp = np.cumsum(np.array(rate_paths, dtype=np.float64).reshape(len(scenarios), n), axis=1)
+    yearly_waccs = np.maximum(base_wacc + cumulative_bp / 10000.0, 0.04)
 
     # Terminal WACC = base + total adjustment
-    terminal_wacc = max(base_wacc + scenario.wacc_adj, 0.04)
+    adj = np.array([[s.wacc_adj, s.terminal_growth_adj] for s in scenarios], dtype=np.float64)
+    terminal_wacc = np.maximum(base_wacc + adj[:, 0], 0.04)
 
     # Average WACC for summary display
-    avg_wacc = sum(yearly_waccs) / len(yearly_waccs) if yearly_waccs else terminal_wacc
+    avg_wacc = yearly_waccs.mean(axis=1) if n else terminal_wacc
 
-    tg = terminal_growth + scenario.terminal_growth_adj
-    tg = min(tg, terminal_wacc - 0.01)
-    tg = max(tg, 0.005)
+    tg = terminal_growth + adj[:, 1]
+    tg = np.minimum(tg, terminal_wacc - 0.01)
+    tg = np.maximum(tg, 0.005)
 
     # Present value of projected FCFs using cumulative discount
-    pv_fcfs = []
-    cumulative_discount = 1.0
-    for i, fcf in enumerate(fcfs):
-        cumulative_discount *= (1 + yearly_waccs[i])
-        pv = fcf / cumulative_discount
-        pv_fcfs.append(pv)
-
-    pv_fcf_total = sum(pv_fcfs)
+    cumulative_discount = _cumulative_discount(tuple(map(tuple, yearly_waccs.tolist())))
+    pv_fcfs = fcfs / cumulative_discount
+    pv_fcf_total = pv_fcfs.sum(axis=1)
 
     # Terminal value (discounted at terminal WACC)
-    terminal_fcf = fcfs[-1] * (1 + tg)
+    terminal_fcf = fcfs[:, -1] * (1 + tg)
     terminal_value = terminal_fcf / (terminal_wacc - tg)
-    pv_terminal = terminal_value / cumulative_discount
+    pv_terminal = terminal_value / cumulative_discount[:, -1]
 
     enterprise_value = pv_fcf_total + pv_terminal
 
-    net_debt = financials["total_debt"][0] - financials["cash"][0]
+    net_debt = float(fin.total_debt[0] - fin.cash[0])
     equity_value = enterprise_value - net_debt
 
     shares = stock["shares_outstanding"]
-    value_per_share = equity_value / shares if shares > 0 else 0
+    value_per_share = equity_value / shares if shares > 0 else np.zeros_like(equity_value)
 
     current_price = stock["current_price"]
-    upside = (value_per_share - current_price) / current_price if current_price > 0 else 0
+    upside = ((value_per_share - current_price) / current_price if current_price > 0
+              else np.zeros_like(value_per_share))
 
-    return {
+    return [{
         "scenario": scenario.name,
         "scenario_description": scenario.description,
-        "wacc": avg_wacc,
-        "terminal_wacc": terminal_wacc,
-        "yearly_waccs": yearly_waccs,
-        "rate_path_bp": rate_path[:n],
-        "terminal_growth": tg,
-        "pv_fcfs": pv_fcfs,
-        "pv_fcf_total": pv_fcf_total,
-        "terminal_value": terminal_value,
-        "pv_terminal_value": pv_terminal,
-        "enterprise_value": enterprise_value,
+        "wacc": float(avg_wacc[i]),
+        "terminal_wacc": float(terminal_wacc[i]),
+        "yearly_waccs": yearly_waccs[i].tolist(),
+        "rate_path_bp": rate_paths[i],
+        "terminal_growth": float(tg[i]),
+        "discount_factors": (1.0 / cumulative_discount[i]).tolist(),
+        "pv_fcfs": pv_fcfs[i].tolist(),
+        "pv_fcf_total": float(pv_fcf_total[i]),
+        "terminal_value": float(terminal_value[i]),
+        "pv_terminal_value": float(pv_terminal[i]),
+        "enterprise_value": float(enterprise_value[i]),
         "net_debt": net_debt,
-        "equity_value": equity_value,
+        "equity_value": float(equity_value[i]),
         "shares_outstanding": shares,
-        "implied_share_price": value_per_share,
+        "implied_share_price": float(value_per_share[i]),
         "current_price": current_price,
-        "upside_downside": upside,
-    }
+        "upside_downside": float(upside[i]),
+    } for i, scenario in enumerate(scenarios)]
+
+
+def compute_dcf(projection: dict, wacc_data: dict, scenario: Scenario,
+                stock: dict, financials: Union[dict, FinancialsSOA],
+                terminal_growth: float = 0.025) -> dict:
+    """
+    Compute enterprise value via DCF, then derive equity value per share.
+
+    Uses year-by-year WACC adjustments from the scenario's rate_path_bp
+    to model how changing interest rates affect the discount rate over time.
+
+    Terminal Value = FCF_n * (1 + g) / (WACC_terminal - g)   [Gordon Growth Model]
+    """
+    fcfs = np.asarray([projection["projected_fcf"]], dtype=np.float64)
+    return _dcf_batch(fcfs, wacc_data, [scenario], stock,
+                      financials_to_soa(financials), terminal_growth)[0]
+
+
+# ============================================================================
+# SENSITIVITY KERNEL
+# ============================================================================
+
+@njit(cache=True)
+def _sensitivity_grid_loop(waccs, terminal_growths, fcfs, net_debt, shares):
+    """sensitivity_grid as explicit loops, for numba to compile."""
+    n = len(fcfs)
+    grid = np.empty((len(waccs), len(terminal_growths)))
+    for i in range(len(waccs)):
+        wacc = waccs[i]
+        pv_fcf_total = 0.0
+        inv = 1.0 / (1 + wacc)
+        discount_n = 1.0
+        for k in range(n):
+            discount_n *= inv
+            pv_fcf_total += fcfs[k] * discount_n
+
+        for j in range(len(terminal_growths)):
+            tg = terminal_growths[j]
+            if wacc <= tg:
+                grid[i, j] = np.nan
+                continue
+            terminal_value = fcfs[n - 1] * (1 + tg) / (wacc - tg)
+            enterprise_value = pv_fcf_total + terminal_value * discount_n
+            grid[i, j] = (enterprise_value - net_debt) / shares if shares > 0 else 0.0
+    return grid
+
+
+def _sensitivity_grid_numpy(waccs, terminal_growths, fcfs, net_debt, shares):
+    """sensitivity_grid by broadcasting a WACC column against a g row."""
+    n = len(fcfs)
+    w = waccs[:, None]
+    tg = terminal_growths[None, :]
+    discounts = 1.0 / np.cumprod(np.repeat(1 + w, n, axis=1), axis=1)  # (1+w)**-1 .. (1+w)**-n
+    pv_fcf_total = (discounts @ fcfs)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terminal_value = fcfs[n - 1] * (1 + tg) / (w - tg)
+        enterprise_value = pv_fcf_total + terminal_value * discounts[:, -1:]
+        grid = (enterprise_value - net_debt) / shares if shares > 0 else np.zeros_like(enterprise_value)
+    return np.where(w <= tg, np.nan, grid)
+
+
+# Implied share price for every (WACC, terminal growth) pair, discounting the
+# projected FCFs at a constant WACC.  Takes float64 arrays and returns a
+# len(waccs) x len(terminal_growths) array with NaN where WACC <= g.  The
+# loop form is only worth it compiled; interpreted, one broadcast pass wins.
+sensitivity_grid = _sensitivity_grid_loop if HAS_NUMBA else _sensitivity_grid_numpy
+
+
+@njit(cache=True)
+def _growth_margin_grid_loop(base_rev, growths, margins, tax_rate, da_pct, capex_pct,
+                             wacc, tg, n, net_debt, shares):
+    """growth_margin_grid as explicit loops, for numba to compile."""
+    grid = np.empty((len(growths), len(margins)))
+
+    # Every cell discounts at the same WACC: one factor per year for the grid
+    discounts = np.empty(n)
+    discount = 1.0
+    for k in range(n):
+        discount /= 1 + wacc
+        discounts[k] = discount
+    terminal_factor = (1 + tg) / (wacc - tg) * discount if wacc > tg else 0.0
+
+    for i in range(len(growths)):
+        # FCF is revenue times a per-margin constant, so the revenue ladder
+        # is projected and discounted once per growth rate and then scaled
+        pv_rev = 0.0
+        rev = 0.0
+        for yr in range(1, n + 1):
+            fade = 1 - (yr - 1) / (n * 2)
+            rev = base_rev * (1 + growths[i] * fade) ** yr
+            pv_rev += rev * discounts[yr - 1]
+        pv_terminal_rev = rev * terminal_factor
+
+        for j in range(len(margins)):
+            fcf_margin = max(margins[j], 0.01) * (1 - tax_rate) + da_pct - capex_pct
+            enterprise_value = fcf_margin * (pv_rev + pv_terminal_rev)
+            grid[i, j] = (enterprise_value - net_debt) / shares if shares > 0 else 0.0
+    return grid
+
+
+def _growth_margin_grid_numpy(base_rev, growths, margins, tax_rate, da_pct, capex_pct,
+                              wacc, tg, n, net_debt, shares):
+    """growth_margin_grid as a discounted revenue ladder per growth times an FCF margin per margin."""
+    yr = np.arange(1, n + 1)
+    fade = 1 - (yr - 1) / (n * 2)
+    rev = base_rev * (1 + growths[:, None] * fade) ** yr               # (G, n)
+    discounts = np.cumprod(np.full(n, 1.0 / (1 + wacc)))
+    pv_rev = rev @ discounts
+    if wacc > tg:
+        pv_rev = pv_rev + rev[:, -1] * (1 + tg) / (wacc - tg) * discounts[-1]
+    fcf_margin = np.maximum(margins, 0.01) * (1 - tax_rate) + da_pct - capex_pct
+    enterprise_value = pv_rev[:, None] * fcf_margin[None, :]          # (G, M)
+    if shares > 0:
+        return (enterprise_value - net_debt) / shares
+    return np.zeros_like(enterprise_value)
+
+
+# Implied share price for every (revenue growth, operating margin) pair at a
+# fixed WACC and terminal growth.  Each growth rate fades linearly to half by
+# year N and each margin is held flat.  Takes float64 growth/margin arrays
+# and returns a len(growths) x len(margins) array.
+growth_margin_grid = _growth_margin_grid_loop if HAS_NUMBA else _growth_margin_grid_numpy
 
 
 # ============================================================================
 # RUN ALL SCENARIOS
 # ============================================================================
 
+def _financials_key(fin: FinancialsSOA) -> tuple:
+    """Hashable snapshot of a FinancialsSOA's contents, used as a memo key."""
+    return tuple(tuple(getattr(fin, name).tolist()) for name in FinancialsSOA.__dataclass_fields__)
+
+
+@functools.lru_cache(maxsize=256)
+def _memo_metrics(fin_key: tuple) -> dict:
+    """compute_historical_metrics, memoized on the financials' contents."""
+    return compute_historical_metrics(FinancialsSOA(*map(np.asarray, fin_key)))
+
+
+@functools.lru_cache(maxsize=256)
+def _memo_wacc(fin_key: tuple, beta, market_cap, current_price, shares,
+               risk_free_rate: float, equity_risk_premium: float, tax_rate: float) -> dict:
+    """compute_wacc, memoized on exactly the inputs it reads."""
+    stock = {"beta": beta, "market_cap": market_cap,
+             "current_price": current_price, "shares_outstanding": shares}
+    return compute_wacc(stock, FinancialsSOA(*map(np.asarray, fin_key)),
+                        {"risk_free_rate": risk_free_rate}, equity_risk_premium, tax_rate)
+
+
 def run_all_scenarios(stock: dict, financials: dict, rates: dict,
                       projection_years: int = 5,
                       terminal_growth: float = 0.025,
@@ -396,17 +611,27 @@ def run_all_scenarios(stock: dict, financials: dict, rates: dict,
     Run the full DCF model for all scenarios.
     Returns a dict with all intermediate and final results.
     """
-    wacc_data = compute_wacc(stock, financials, rates, equity_risk_premium)
-    metrics = compute_historical_metrics(financials)
+    # Convert once; every scenario below reads the same arrays.  Metrics and
+    # WACC are memoized so sweeps over terminal growth / ERP on the same
+    # company skip them (the cached dicts are shared — treat as read-only).
+    fin = financials_to_soa(financials)
+    fin_key = _financials_key(fin)
+    metrics = _memo_metrics(fin_key)
+    wacc_data = _memo_wacc(fin_key, stock.get("beta"), stock.get("market_cap"),
+                           stock["current_price"], stock["shares_outstanding"],
+                           rates["risk_free_rate"], equity_risk_premium, metrics["tax_rate"])
+
+    # All scenarios share one (S, N) projection and valuation pass
+    scenarios = list(SCENARIOS.values())
+    batch = _project_batch(fin, metrics, scenarios, projection_years)
+    dcfs = _dcf_batch(batch["projected_fcf"], wacc_data, scenarios, stock, fin, terminal_growth)
 
     results = {}
-    for key, scenario in SCENARIOS.items():
-        projection = project_fcf(financials, metrics, scenario, projection_years)
-        dcf = compute_dcf(projection, wacc_data, scenario, stock, financials, terminal_growth)
+    for i, (key, scenario) in enumerate(SCENARIOS.items()):
         results[key] = {
             "scenario": scenario,
-            "projection": projection,
-            "dcf": dcf,
+            "projection": _projection_dict(scenario, projection_years, metrics["tax_rate"], batch, i),
+            "dcf": dcfs[i],
         }
 
     return {
@@ -428,17 +653,22 @@ if __name__ == "__main__":
 
     result = run_all_scenarios(data["stock"], data["financials"], data["rates"])
 
-    print(f"\n{'='*70}")
-    print(f"  DCF VALUATION — {ticker}  (data source: {data['source']})")
-    print(f"{'='*70}")
-    print(f"\n  WACC: {result['wacc_data']['wacc']:.2%}")
-    print(f"  Cost of Equity: {result['wacc_data']['cost_of_equity']:.2%}")
-    print(f"  Cost of Debt:   {result['wacc_data']['cost_of_debt']:.2%}")
-    print(f"  Tax Rate:       {result['wacc_data']['tax_rate']:.2%}")
-
-    print(f"\n  Current Price: ${data['stock']['current_price']:.2f}")
-    print(f"\n  {'Scenario':<20} {'Implied Price':>15} {'Upside/Downside':>18}")
-    print(f"  {'-'*53}")
-    for key in ["bull", "base", "bear", "rate_hike", "rate_cut"]:
-        r = result["scenarios"][key]["dcf"]
-        print(f"  {r['scenario']:<20} ${r['implied_share_price']:>13,.2f} {r['upside_downside']:>17.1%}")
+    wacc = result["wacc_data"]
+    lines = [
+        f"\n{'='*70}",
+        f"  DCF VALUATION — {ticker}  (data source: {data['source']})",
+        f"{'='*70}",
+        f"\n  WACC: {wacc['wacc']:.2%}",
+        f"  Cost of Equity: {wacc['cost_of_equity']:.2%}",
+        f"  Cost of Debt:   {wacc['cost_of_debt']:.2%}",
+        f"  Tax Rate:       {wacc['tax_rate']:.2%}",
+        f"\n  Current Price: ${data['stock']['current_price']:.2f}",
+        f"\n  {'Scenario':<20} {'Implied Price':>15} {'Upside/Downside':>18}",
+        f"  {'-'*53}",
+    ]
+    dcfs = [result["scenarios"][key]["dcf"] for key in ["bull", "base", "bear", "rate_hike", "rate_cut"]]
+    lines += [
+        f"  {r['scenario']:<20} ${r['implied_share_price']:>13,.2f} {r['upside_downside']:>17.1%}"
+        for r in dcfs
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
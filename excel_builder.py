@@ -17,16 +17,30 @@ Generates a professionally formatted Excel workbook containing:
   Sheet 12: Sensitivity      — WACC vs Terminal Growth sensitivity table
 """
 
-from openpyxl import Workbook
+from openpyxl import Workbook, LXML
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import (
-    Font, PatternFill, Alignment, Border, Side, numbers
+    Font, PatternFill, Alignment, Border, Side, NamedStyle, numbers
 )
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.chart import BarChart, LineChart, PieChart, AreaChart, Reference
 from openpyxl.chart.series import SeriesLabel, DataPoint
 from openpyxl.chart.label import DataLabelList
+from copy import copy
 from datetime import datetime
 
+import numpy as np
+
+from dcf_engine import growth_margin_grid, sensitivity_grid
+
+# openpyxl serializes through lxml when it is importable and falls back to
+# the much slower stdlib writer otherwise; say so once, at import
+if not LXML:
+    print("[excel_builder] lxml not available; workbooks will be written with the slower "
+          "stdlib XML backend. Install with: pip install lxml")
+
 
 # ============================================================================
 # STYLE CONSTANTS
@@ -47,39 +61,58 @@ DARK_TEXT = "1A1A1A"
 MONEY_GREEN = "E8F5E9"
 MONEY_RED = "FFEBEE"
 
+
+def _argb(rgb):
+    """Opaque ARGB for cell styles; a bare RGB is read as alpha 00."""
+    return "FF" + rgb
+
+
 # Chart color palette (hex without #)
 CHART_COLORS = ["2E5090", "27AE60", "E74C3C", "F39C12", "0097A7", "8E24AA", "1B2A4A"]
 
 # Fonts
-TITLE_FONT = Font(name="Calibri", size=18, bold=True, color=WHITE)
-HEADER_FONT = Font(name="Calibri", size=11, bold=True, color=WHITE)
-SUBHEADER_FONT = Font(name="Calibri", size=11, bold=True, color=DARK_BLUE)
-LABEL_FONT = Font(name="Calibri", size=10, color=DARK_TEXT)
-VALUE_FONT = Font(name="Calibri", size=10, color=DARK_TEXT)
-SMALL_FONT = Font(name="Calibri", size=9, color="666666")
-LINK_FONT = Font(name="Calibri", size=10, color=MED_BLUE, underline="single")
-BOLD_VALUE = Font(name="Calibri", size=10, bold=True, color=DARK_TEXT)
-BIG_NUMBER = Font(name="Calibri", size=14, bold=True, color=DARK_BLUE)
-GREEN_FONT = Font(name="Calibri", size=10, bold=True, color=ACCENT_GREEN)
-RED_FONT = Font(name="Calibri", size=10, bold=True, color=ACCENT_RED)
+TITLE_FONT = Font(name="Calibri", size=18, bold=True, color=_argb(WHITE))
+HEADER_FONT = Font(name="Calibri", size=11, bold=True, color=_argb(WHITE))
+SUBHEADER_FONT = Font(name="Calibri", size=11, bold=True, color=_argb(DARK_BLUE))
+LABEL_FONT = Font(name="Calibri", size=10, color=_argb(DARK_TEXT))
+VALUE_FONT = Font(name="Calibri", size=10, color=_argb(DARK_TEXT))
+SMALL_FONT = Font(name="Calibri", size=9, color=_argb("666666"))
+LINK_FONT = Font(name="Calibri", size=10, color=_argb(MED_BLUE), underline="single")
+BOLD_VALUE = Font(name="Calibri", size=10, bold=True, color=_argb(DARK_TEXT))
+BIG_NUMBER = Font(name="Calibri", size=14, bold=True, color=_argb(DARK_BLUE))
+GREEN_FONT = Font(name="Calibri", size=10, bold=True, color=_argb(ACCENT_GREEN))
+RED_FONT = Font(name="Calibri", size=10, bold=True, color=_argb(ACCENT_RED))
+BIG_GREEN_FONT = Font(name="Calibri", size=14, bold=True, color=_argb(ACCENT_GREEN))
+BIG_RED_FONT = Font(name="Calibri", size=14, bold=True, color=_argb(ACCENT_RED))
+SUBTITLE_FONT = Font(name="Calibri", size=10, color=_argb(LIGHT_BLUE))
+SUBTITLE_ITALIC_FONT = Font(name="Calibri", size=10, italic=True, color=_argb(LIGHT_BLUE))
+NOTE_FONT = Font(name="Calibri", size=10, italic=True, color=_argb("666666"))
+CODE_FONT = Font(name="Consolas", size=9, color=_argb(MED_BLUE))
+CODE_FONT_LARGE = Font(name="Consolas", size=10, color=_argb(MED_BLUE))
 
 # Fills
-TITLE_FILL = PatternFill(start_color=DARK_BLUE, end_color=DARK_BLUE, fill_type="solid")
-HEADER_FILL = PatternFill(start_color=MED_BLUE, end_color=MED_BLUE, fill_type="solid")
-LIGHT_FILL = PatternFill(start_color=LIGHT_BLUE, end_color=LIGHT_BLUE, fill_type="solid")
-ALT_ROW_FILL = PatternFill(start_color=LIGHT_GRAY, end_color=LIGHT_GRAY, fill_type="solid")
-GREEN_FILL = PatternFill(start_color=MONEY_GREEN, end_color=MONEY_GREEN, fill_type="solid")
-RED_FILL = PatternFill(start_color=MONEY_RED, end_color=MONEY_RED, fill_type="solid")
-WHITE_FILL = PatternFill(start_color=WHITE, end_color=WHITE, fill_type="solid")
+TITLE_FILL = PatternFill(start_color=_argb(DARK_BLUE), end_color=_argb(DARK_BLUE), fill_type="solid")
+HEADER_FILL = PatternFill(start_color=_argb(MED_BLUE), end_color=_argb(MED_BLUE), fill_type="solid")
+LIGHT_FILL = PatternFill(start_color=_argb(LIGHT_BLUE), end_color=_argb(LIGHT_BLUE), fill_type="solid")
+ALT_ROW_FILL = PatternFill(start_color=_argb(LIGHT_GRAY), end_color=_argb(LIGHT_GRAY), fill_type="solid")
+GREEN_FILL = PatternFill(start_color=_argb(MONEY_GREEN), end_color=_argb(MONEY_GREEN), fill_type="solid")
+RED_FILL = PatternFill(start_color=_argb(MONEY_RED), end_color=_argb(MONEY_RED), fill_type="solid")
+WHITE_FILL = PatternFill(start_color=_argb(WHITE), end_color=_argb(WHITE), fill_type="solid")
 
 # Borders
 THIN_BORDER = Border(
-    left=Side(style="thin", color=MED_GRAY),
-    right=Side(style="thin", color=MED_GRAY),
-    top=Side(style="thin", color=MED_GRAY),
-    bottom=Side(style="thin", color=MED_GRAY),
+    left=Side(style="thin", color=_argb(MED_GRAY)),
+    right=Side(style="thin", color=_argb(MED_GRAY)),
+    top=Side(style="thin", color=_argb(MED_GRAY)),
+    bottom=Side(style="thin", color=_argb(MED_GRAY)),
+)
+BOTTOM_BORDER = Border(bottom=Side(style="medium", color=_argb(DARK_BLUE)))
+BASE_ROW_BORDER = Border(
+    left=Side(style="thin", color=_argb(MED_GRAY)),
+    right=Side(style="thin", color=_argb(MED_GRAY)),
+    top=Side(style="medium", color=_argb(DARK_BLUE)),
+    bottom=Side(style="medium", color=_argb(DARK_BLUE)),
 )
-BOTTOM_BORDER = Border(bottom=Side(style="medium", color=DARK_BLUE))
 
 # Alignments
 CENTER = Alignment(horizontal="center", vertical="center")
@@ -87,6 +120,9 @@ LEFT = Alignment(horizontal="left", vertical="center")
 RIGHT = Alignment(horizontal="right", vertical="center")
 WRAP = Alignment(horizontal="left", vertical="center", wrap_text=True)
 
+# Column letters by index - 1, for A1 references without per-call conversion
+COL_LETTERS = tuple(get_column_letter(c) for c in range(1, 16385))
+
 # Number formats
 FMT_DOLLAR = '#,##0'
 FMT_DOLLAR_M = '#,##0.0,,"M"'
@@ -97,86 +133,343 @@ FMT_PRICE = '$#,##0.00'
 FMT_NUM = '#,##0'
 FMT_RATIO = '0.00x'
 
+# Named styles for the cells the row helpers write.  build_workbook builds
+# and registers a fresh NamedStyle per entry on each workbook (a NamedStyle
+# binds to one workbook), so a cell is then styled by one name assignment.
+NAMED_STYLES = [
+    dict(name="dcf_title", font=TITLE_FONT, alignment=LEFT, fill=TITLE_FILL),
+    dict(name="dcf_header", font=HEADER_FONT, alignment=CENTER, fill=HEADER_FILL, border=THIN_BORDER),
+    dict(name="dcf_subheader", font=SUBHEADER_FONT, alignment=LEFT, fill=LIGHT_FILL, border=THIN_BORDER),
+    dict(name="dcf_label", font=LABEL_FONT, alignment=LEFT, border=THIN_BORDER),
+    dict(name="dcf_label_bold", font=BOLD_VALUE, alignment=LEFT, border=THIN_BORDER),
+    dict(name="dcf_value", font=VALUE_FONT, alignment=RIGHT, border=THIN_BORDER),
+    dict(name="dcf_value_bold", font=BOLD_VALUE, alignment=RIGHT, border=THIN_BORDER),
+    dict(name="dcf_value_text", font=VALUE_FONT, alignment=LEFT, border=THIN_BORDER),
+]
+
+# Font passed to a row helper -> named style carrying that font
+LABEL_STYLES = {LABEL_FONT: "dcf_label", BOLD_VALUE: "dcf_label_bold"}
+
+# (font, number format) passed to a row helper -> named style carrying both
+VALUE_STYLES = {(VALUE_FONT, None): "dcf_value", (BOLD_VALUE, None): "dcf_value_bold"}
+for _suffix, _fmt in [("dollar", FMT_DOLLAR), ("m", FMT_DOLLAR_M), ("b", FMT_DOLLAR_B),
+                      ("pct", FMT_PCT), ("pct2", FMT_PCT2), ("price", FMT_PRICE)]:
+    for _font, _base in [(VALUE_FONT, "dcf_value"), (BOLD_VALUE, "dcf_value_bold")]:
+        NAMED_STYLES.append(dict(name=f"{_base}_{_suffix}", font=_font, alignment=RIGHT,
+                                 border=THIN_BORDER, number_format=_fmt))
+        VALUE_STYLES[(_font, _fmt)] = f"{_base}_{_suffix}"
+
+# Alternate-row variant of every label/value style: "<name>_alt" adds the
+# alt-row fill, so a banded row still takes one style assignment per cell
+NAMED_STYLES += [dict(spec, name=spec["name"] + "_alt", fill=ALT_ROW_FILL)
+                 for spec in NAMED_STYLES
+                 if spec["name"].startswith(("dcf_label", "dcf_value"))]
+
+# Sensitivity grid cells: bold centred axis labels and centred prices, the
+# latter banded red / plain / green against the current price
+_GRID = dict(alignment=CENTER, border=THIN_BORDER)
+NAMED_STYLES += [
+    dict(_GRID, name="dcf_grid_axis_pct", font=BOLD_VALUE, number_format=FMT_PCT),
+    dict(_GRID, name="dcf_grid_axis_pct2", font=BOLD_VALUE, number_format=FMT_PCT2),
+    dict(_GRID, name="dcf_grid_axis_pct2_alt", font=BOLD_VALUE, number_format=FMT_PCT2,
+         fill=ALT_ROW_FILL),
+    dict(_GRID, name="dcf_grid_na", font=DEFAULT_FONT),
+    dict(_GRID, name="dcf_grid_price", font=VALUE_FONT, number_format=FMT_PRICE),
+    dict(_GRID, name="dcf_grid_price_plain", font=DEFAULT_FONT, number_format=FMT_PRICE),
+    dict(_GRID, name="dcf_grid_price_red", font=RED_FONT, fill=RED_FILL, number_format=FMT_PRICE),
+    dict(_GRID, name="dcf_grid_price_green", font=GREEN_FONT, fill=GREEN_FILL, number_format=FMT_PRICE),
+]
+# "<name>_base" swaps in the base-case row's heavier border
+NAMED_STYLES += [dict(spec, name=spec["name"] + "_base", border=BASE_ROW_BORDER)
+                 for spec in NAMED_STYLES
+                 if spec["name"].startswith(("dcf_grid_price", "dcf_grid_na"))]
+
+# Sensitivity price bands (below / near / above current price) -> named style
+SENSITIVITY_BANDS = ("dcf_grid_price_red", "dcf_grid_price", "dcf_grid_price_green")
+GROWTH_MARGIN_BANDS = ("dcf_grid_price_red", "dcf_grid_price_plain", "dcf_grid_price_green")
+
+
+# Order scenarios appear in on the summary and comparison views
+SCENARIO_ORDER = ("bull", "base", "bear", "rate_hike", "rate_cut")
+
 
 # ============================================================================
 # HELPERS
 # ============================================================================
 
-def _fmt_large(val):
-    """Pick appropriate number format for large values."""
-    if abs(val) >= 1e9:
-        return FMT_DOLLAR_B
-    elif abs(val) >= 1e6:
-        return FMT_DOLLAR_M
-    return FMT_DOLLAR
+# Decimal places kept for a float written under a number format: whole
+# cents for money and counts, six places for rates, ratios and factors.
+# Nothing displays finer than that, and shorter reprs mean smaller sheet XML.
+MONEY_FORMATS = frozenset({FMT_DOLLAR, FMT_DOLLAR_M, FMT_DOLLAR_B, FMT_PRICE, FMT_NUM})
+
 
+def _round_digits(fmt):
+    return 2 if fmt in MONEY_FORMATS else 6
 
-def _set_col_widths(ws, widths: dict):
-    for col, w in widths.items():
-        ws.column_dimensions[get_column_letter(col)].width = w
+
+# _fmt_large result by magnitude bucket: < 1e6, < 1e9, >= 1e9
+_FMT_LARGE_TABLE = (FMT_DOLLAR, FMT_DOLLAR_M, FMT_DOLLAR_B)
+
+
+def _fmt_large(val):
+    """Pick appropriate number format for large values."""
+    a = abs(val)
+    return _FMT_LARGE_TABLE[(a >= 1e6) + (a >= 1e9)]
+
+
+def _fmt_large_row(values):
+    """One large-value format for a whole row, chosen by its largest magnitude."""
+    return _fmt_large(max((abs(v) for v in values if isinstance(v, (int, float))),
+                          default=0))
+
+
+def _ratio(num, den):
+    """num / den elementwise, as a list; a zero denominator divides by 1."""
+    den = np.asarray(den, dtype=np.float64)
+    return (np.asarray(num, dtype=np.float64) / np.where(den == 0, 1.0, den)).tolist()
+
+
+def _billions(values, n=None, divisor=1e9):
+    """
+    The first *n* values (all by default) divided by *divisor* ($ billions
+    unless given), as a list.  None and NaN entries are charted as 0.
+    """
+    a = np.asarray(values[:n], dtype=np.float64)
+    return (np.where(np.isnan(a) | (a == 0), 0.0, a) / divisor).tolist()
+
+
+def _projection_years(financials, n_proj):
+    """Year labels for the *n_proj* years after the latest historical one."""
+    return (int(financials["years"][0]) + np.arange(1, n_proj + 1)).astype(str).tolist()
+
+
+def _band_styles(grid, current_price, bands):
+    """
+    Named style for every price in a sensitivity grid: bands[0] for >10%
+    below *current_price*, bands[1] within 10%, bands[2] >10% above, and
+    "dcf_grid_na" where the price is NaN.  Returned as nested lists.
+    """
+    idx = 1 + (grid > current_price * 1.1).astype(np.int8) - (grid < current_price * 0.9)
+    idx[np.isnan(grid)] = 3
+    return np.array([*bands, "dcf_grid_na"], dtype=object)[idx].tolist()
+
+
+class _SheetBuffer:
+    """
+    Random-access front for a write-only worksheet.
+
+    The builders address cells by (row, column), revisit them and read some
+    values back for charts, none of which a streaming sheet allows.  Cells
+    are collected here as WriteOnlyCells and streamed to the real sheet in
+    row order by flush().  Row heights and column widths are held in
+    heights/widths until then too: a write-only sheet emits its column
+    widths with the first row and each row's height with that row, so
+    flush() hands both over before streaming anything.  Merges are held
+    back until the rows are out; charts go straight to the underlying sheet,
+    which writes them out at save time.
+
+    set_style()/set_styles() apply a named style from a StyleArray resolved
+    once per sheet, skipping the by-name search that `cell.style = name` does.
+    """
+
+    __slots__ = ("_ws", "_cells", "_merges", "_styles", "heights", "widths", "sheet_properties")
+
+    def __init__(self, ws):
+        self._ws = ws
+        self._cells = {}
+        self._merges = []
+        self._styles = {style.name: style.as_tuple() for style in ws.parent._named_styles}
+        self.heights = {}
+        self.widths = {}
+        self.sheet_properties = ws.sheet_properties
+
+    @property
+    def title(self):
+        return self._ws.title
+
+    def cell(self, row, column, value=None):
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = WriteOnlyCell(self._ws, value)
+            cell.row, cell.column = row, column
+            self._cells[(row, column)] = cell
+        elif value is not None:
+            cell.value = value
+        return cell
+
+    def write_row(self, row, values, start_col=1):
+        """Set a run of cells in one row; returns them in order."""
+        # Same as cell() per value, inlined: this carries most of the writes
+        cells, ws = self._cells, self._ws
+        out = []
+        for col, value in enumerate(values, start_col):
+            cell = cells.get((row, col))
+            if cell is None:
+                cell = cells[(row, col)] = WriteOnlyCell(ws, value)
+                cell.row, cell.column = row, col
+            elif value is not None:
+                cell.value = value
+            out.append(cell)
+        return out
+
+    def set_style(self, cell, name):
+        cell._style = copy(self._styles[name])
+
+    def set_styles(self, cells, name):
+        style = self._styles[name]
+        for cell in cells:
+            cell._style = copy(style)
+
+    def set_height(self, row, height):
+        self.heights[row] = height
+
+    def set_width(self, column, width):
+        self.widths[column] = width
+
+    def merge_cells(self, start_row, start_column, end_row, end_column):
+        self._merges.append(CellRange(min_row=start_row, min_col=start_column,
+                                      max_row=end_row, max_col=end_column))
+
+    def add_chart(self, chart, anchor=None):
+        self._ws.add_chart(chart, anchor)
+
+    def flush(self):
+        """Stream all buffered rows to the worksheet.  Call once per sheet."""
+        # Edge cells of a merged range take their borders from the top-left
+        # cell, as openpyxl's MergedCellRange.format() does in normal mode
+        for cr in self._merges:
+            start = self.cell(cr.min_row, cr.min_col)
+            for name in ("top", "left", "right", "bottom"):
+                side = getattr(start.border, name)
+                if side is None or side.style is None:
+                    continue
+                border = Border(**{name: side})
+                for row, col in getattr(cr, name):
+                    cell = self.cell(row, col)
+                    cell.border += border
+
+        for col, width in self.widths.items():
+            self._ws.column_dimensions[COL_LETTERS[col - 1]].width = width
+        for row, height in self.heights.items():
+            self._ws.row_dimensions[row].height = height
+
+        rows = {}
+        for (row, col), cell in self._cells.items():
+            rows.setdefault(row, {})[col] = cell
+        last_row = max([*rows, *self.heights], default=0)
+        for row in range(1, last_row + 1):
+            cols = rows.get(row, {})
+            self._ws.append([cols.get(c) for c in range(1, max(cols, default=0) + 1)])
+        self._cells.clear()
+
+        # Merges are registered only once every row is out; the sheet
+        # writes them after sheetData at save time.  The builders never
+        # overlap merges, so the set is filled directly rather than through
+        # MultiCellRange.add, which scans every existing range per call.
+        self._ws.merged_cells.ranges.update(self._merges)
+        self._merges.clear()
+
+
+def _transpose_scenarios(dcfs, fields):
+    """Scenario DCF results by field: {field: [value per scenario, in order]}."""
+    return {f: [dcf[f] for dcf in dcfs] for f in fields}
+
+
+def _timestamp():
+    """The "Generated:" stamp shown on the dashboard."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _new_sheet(wb, title):
+    """Create a sheet on a write-only workbook, wrapped in a _SheetBuffer."""
+    return _SheetBuffer(wb.create_sheet(title=title))
+
+
+def _set_col_widths(ws, widths: dict, rest=None, max_col=0):
+    """Set the widths in *widths*, then *rest* for every other column up to *max_col*."""
+    if rest is not None:
+        ws.widths.update(dict.fromkeys(range(1, max_col + 1), rest))
+    ws.widths.update(widths)
 
 
 def _write_title_row(ws, row, text, max_col=10):
     ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=max_col)
     cell = ws.cell(row=row, column=1, value=text)
-    cell.font = TITLE_FONT
-    cell.fill = TITLE_FILL
-    cell.alignment = Alignment(horizontal="left", vertical="center")
-    ws.row_dimensions[row].height = 36
+    ws.set_style(cell, "dcf_title")
+    ws.set_height(row, 36)
 
 
 def _write_header_row(ws, row, headers, start_col=1):
-    for i, h in enumerate(headers):
-        cell = ws.cell(row=row, column=start_col + i, value=h)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
+    cells = ws.write_row(row, headers, start_col)
+    ws.set_styles(cells, "dcf_header")
+    return cells
+
+
+def _apply_style(ws, cell, name, font, default, fmt=None):
+    """
+    Style a cell by its named style, or — for a font/format combination
+    without one — by *default* plus explicit font and number format.
+    """
+    if name:
+        ws.set_style(cell, name)
+        return
+    ws.set_style(cell, default)
+    cell.font = font
+    if fmt:
+        cell.number_format = fmt
 
 
 def _write_data_row(ws, row, label, values, start_col=1, fmt=FMT_DOLLAR_B,
                     label_font=LABEL_FONT, value_font=VALUE_FONT, alt=False):
-    cell = ws.cell(row=row, column=start_col, value=label)
-    cell.font = label_font
-    cell.alignment = LEFT
-    cell.border = THIN_BORDER
-    if alt:
-        cell.fill = ALT_ROW_FILL
+    """
+    Write a label followed by a row of values, all in one number format
+    (use _fmt_large_row to pick a large-value format for the row).
+    *values* may be a numpy array; it is converted to floats in one go.
+    Returns the label cell followed by the value cells.
+    """
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    digits = _round_digits(fmt)
+    values = [round(v, digits) if type(v) is float else v for v in values]
+
+    suffix = "_alt" if alt else ""
+    label_cell, *value_cells = ws.write_row(row, [label, *values], start_col)
+    label_style = LABEL_STYLES.get(label_font)
+    _apply_style(ws, label_cell, label_style and label_style + suffix, label_font,
+                 "dcf_label" + suffix)
+
+    value_style = VALUE_STYLES.get((value_font, fmt or None))
+    if value_style:
+        ws.set_styles(value_cells, value_style + suffix)
+    else:
+        for cell in value_cells:
+            _apply_style(ws, cell, None, value_font, "dcf_value" + suffix, fmt)
+    return [label_cell, *value_cells]
 
-    for i, v in enumerate(values):
-        cell = ws.cell(row=row, column=start_col + 1 + i, value=v)
-        cell.font = value_font
-        cell.alignment = RIGHT
-        cell.border = THIN_BORDER
-        if fmt:
-            cell.number_format = fmt if not callable(fmt) else fmt(v)
-        if alt:
-            cell.fill = ALT_ROW_FILL
+
+def _write_table(ws, row, rows, start_col=1):
+    """Write a block of unstyled rows (chart source data) from *row* down."""
+    for i, values in enumerate(rows):
+        ws.write_row(row + i, values, start_col)
 
 
 def _write_section_header(ws, row, text, max_col=10):
     ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=max_col)
     cell = ws.cell(row=row, column=1, value=text)
-    cell.font = SUBHEADER_FONT
-    cell.fill = LIGHT_FILL
-    cell.alignment = LEFT
-    cell.border = THIN_BORDER
-    ws.row_dimensions[row].height = 22
+    ws.set_style(cell, "dcf_subheader")
+    ws.set_height(row, 22)
 
 
 def _write_kv(ws, row, col_label, label, col_val, value, fmt=None,
               label_font=LABEL_FONT, value_font=VALUE_FONT):
-    """Write a label-value pair."""
+    """Write a label-value pair; returns the (label, value) cells."""
     c1 = ws.cell(row=row, column=col_label, value=label)
-    c1.font = label_font
-    c1.alignment = LEFT
-    c1.border = THIN_BORDER
+    _apply_style(ws, c1, LABEL_STYLES.get(label_font), label_font, "dcf_label")
+    if type(value) is float:
+        value = round(value, _round_digits(fmt))
     c2 = ws.cell(row=row, column=col_val, value=value)
-    c2.font = value_font
-    c2.alignment = RIGHT
-    c2.border = THIN_BORDER
-    if fmt:
-        c2.number_format = fmt
+    _apply_style(ws, c2, VALUE_STYLES.get((value_font, fmt or None)), value_font, "dcf_value", fmt)
+    return c1, c2
 
 
 def _style_chart(chart, width=28, height=14):
@@ -200,6 +493,26 @@ def _color_series(chart, colors=None):
 # CHART BUILDERS (reusable)
 # ============================================================================
 
+def _add_row_series(chart, ws, data_rows, data_start_col, data_end_col, series_labels):
+    """
+    Add one series per data row.  A contiguous run of rows goes in as a
+    single Reference over the whole block rather than one per row.
+    """
+    data_rows = list(data_rows)[:len(series_labels)]
+    if not data_rows:
+        return
+    if data_rows == list(range(data_rows[0], data_rows[0] + len(data_rows))):
+        blocks = [(data_rows[0], data_rows[-1])]
+    else:
+        blocks = [(r, r) for r in data_rows]
+    for min_row, max_row in blocks:
+        chart.add_data(Reference(ws, min_col=data_start_col, max_col=data_end_col,
+                                 min_row=min_row, max_row=max_row),
+                       from_rows=True, titles_from_data=False)
+    for series, label in zip(chart.series, series_labels):
+        series.tx = SeriesLabel(v=label)
+
+
 def _make_bar_chart(ws, title, y_title, data_rows, cat_row, data_start_col,
                     data_end_col, series_labels, anchor, width=28, height=14,
                     chart_type="col"):
@@ -211,12 +524,9 @@ def _make_bar_chart(ws, title, y_title, data_rows, cat_row, data_start_col,
     chart.y_axis.title = y_title
     _style_chart(chart, width, height)
 
-    cats = Reference(ws, min_col=data_start_col, max_col=data_end_col, min_row=cat_row)
-    for i, (row_idx, label) in enumerate(zip(data_rows, series_labels)):
-        data = Reference(ws, min_col=data_start_col, max_col=data_end_col, min_row=row_idx)
-        chart.add_data(data, from_rows=True, titles_from_data=False)
-        chart.series[i].tx = SeriesLabel(v=label)
-    chart.set_categories(cats)
+    _add_row_series(chart, ws, data_rows, data_start_col, data_end_col, series_labels)
+    chart.set_categories(Reference(ws, min_col=data_start_col, max_col=data_end_col,
+                                   min_row=cat_row))
     _color_series(chart)
     ws.add_chart(chart, anchor)
     return chart
@@ -231,13 +541,11 @@ def _make_line_chart(ws, title, y_title, data_rows, cat_row, data_start_col,
     chart.y_axis.title = y_title
     _style_chart(chart, width, height)
 
-    cats = Reference(ws, min_col=data_start_col, max_col=data_end_col, min_row=cat_row)
-    for i, (row_idx, label) in enumerate(zip(data_rows, series_labels)):
-        data = Reference(ws, min_col=data_start_col, max_col=data_end_col, min_row=row_idx)
-        chart.add_data(data, from_rows=True, titles_from_data=False)
-        chart.series[i].tx = SeriesLabel(v=label)
-        chart.series[i].graphicalProperties.line.width = 22000  # ~2pt
-    chart.set_categories(cats)
+    _add_row_series(chart, ws, data_rows, data_start_col, data_end_col, series_labels)
+    for series in chart.series:
+        series.graphicalProperties.line.width = 22000  # ~2pt
+    chart.set_categories(Reference(ws, min_col=data_start_col, max_col=data_end_col,
+                                   min_row=cat_row))
     _color_series(chart)
     ws.add_chart(chart, anchor)
     return chart
@@ -247,10 +555,10 @@ def _make_line_chart(ws, title, y_title, data_rows, cat_row, data_start_col,
 # SHEET BUILDERS
 # ============================================================================
 
-def build_dashboard(wb, stock, financials, rates, model_result, data_source):
+def build_dashboard(wb, stock, financials, rates, model_result, data_source, charts=True,
+                    generated_at=None):
     """Sheet 1: Company overview dashboard with multiple charts."""
-    ws = wb.active
-    ws.title = "Dashboard"
+    ws = _new_sheet(wb, "Dashboard")
     ws.sheet_properties.tabColor = DARK_BLUE
 
     max_col = 10
@@ -263,10 +571,10 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
     row = 2
     ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=max_col)
     cell = ws.cell(row=row, column=1,
-                   value=f"  {stock['company_name']}  |  Data Source: {data_source.upper()}  |  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    cell.font = Font(name="Calibri", size=10, color=LIGHT_BLUE)
+                   value=f"  {stock['company_name']}  |  Data Source: {data_source.upper()}  |  Generated: {generated_at or _timestamp()}")
+    cell.font = SUBTITLE_FONT
     cell.fill = TITLE_FILL
-    ws.row_dimensions[row].height = 22
+    ws.set_height(row, 22)
 
     # --- Company Info ---
     row = 4
@@ -321,13 +629,16 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
                "Current Price", "Upside/Downside"]
     _write_header_row(ws, row, headers)
 
-    scenario_order = ["bull", "base", "bear", "rate_hike", "rate_cut"]
-    for i, key in enumerate(scenario_order):
+    # Named style for each column of the table above
+    col_styles = (["dcf_value_text"] * 3 + ["dcf_value_pct2"] * 2 + ["dcf_value_b"] * 2
+                  + ["dcf_value_price"] * 2 + ["dcf_value_pct"])
+
+    dcfs = tuple(model_result["scenarios"][key]["dcf"] for key in SCENARIO_ORDER)
+    for i, dcf in enumerate(dcfs):
         r = row + 1 + i
-        dcf = model_result["scenarios"][key]["dcf"]
-        alt = i % 2 == 1
+        suffix = "_alt" if i & 1 else ""
 
-        vals = [
+        cells = ws.write_row(r, [
             dcf["scenario"],
             dcf["scenario_description"],
             "",
@@ -338,22 +649,12 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
             dcf["implied_share_price"],
             dcf["current_price"],
             dcf["upside_downside"],
-        ]
-        fmts = [None, None, None, FMT_PCT2, FMT_PCT2,
-                FMT_DOLLAR_B, FMT_DOLLAR_B, FMT_PRICE, FMT_PRICE, FMT_PCT]
-
-        for j, (v, f) in enumerate(zip(vals, fmts)):
-            cell = ws.cell(row=r, column=1 + j, value=v)
-            cell.font = VALUE_FONT
-            cell.alignment = RIGHT if j >= 3 else LEFT
-            cell.border = THIN_BORDER
-            if f:
-                cell.number_format = f
-            if alt:
-                cell.fill = ALT_ROW_FILL
+        ])
+        for cell, style in zip(cells, col_styles):
+            ws.set_style(cell, style + suffix)
 
         # Color the upside/downside
-        ud_cell = ws.cell(row=r, column=10)
+        ud_cell = cells[9]
         if dcf["upside_downside"] > 0:
             ud_cell.font = GREEN_FONT
         else:
@@ -379,7 +680,7 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
     ]
     for i, (label, vals) in enumerate(hist_items):
         r = row + 1 + i
-        _write_data_row(ws, r, label, vals, fmt=FMT_DOLLAR_B, alt=i % 2 == 1)
+        _write_data_row(ws, r, label, vals, fmt=FMT_DOLLAR_B, alt=i & 1)
 
     # --- Interest Rate Path Summary ---
     row = 31
@@ -387,45 +688,37 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
 
     row = 32
     n_proj = model_result["projection_years"]
-    base_year = int(financials["years"][0])
-    proj_year_labels = [str(base_year + i + 1) for i in range(n_proj)]
+    proj_year_labels = _projection_years(financials, n_proj)
     rate_headers = ["Scenario"] + proj_year_labels + ["Terminal WACC"] + [""] * (max_col - 2 - n_proj)
     _write_header_row(ws, row, rate_headers[:max_col])
 
-    for i, key in enumerate(scenario_order):
+    for i, dcf in enumerate(dcfs):
         r = row + 1 + i
-        dcf = model_result["scenarios"][key]["dcf"]
         yearly = dcf.get("yearly_waccs", [dcf["wacc"]] * n_proj)
         terminal = dcf.get("terminal_wacc", dcf["wacc"])
         rate_bp = dcf.get("rate_path_bp", [0] * n_proj)
 
-        cell = ws.cell(row=r, column=1, value=dcf["scenario"])
-        cell.font = LABEL_FONT
-        cell.border = THIN_BORDER
-
-        for j in range(min(n_proj, len(yearly))):
-            cell = ws.cell(row=r, column=2 + j, value=yearly[j])
-            cell.font = VALUE_FONT
-            cell.alignment = RIGHT
-            cell.border = THIN_BORDER
-            cell.number_format = FMT_PCT2
-
-        cell = ws.cell(row=r, column=2 + n_proj, value=terminal)
-        cell.font = BOLD_VALUE
-        cell.alignment = RIGHT
-        cell.border = THIN_BORDER
-        cell.number_format = FMT_PCT2
+        label_cell, *cells = ws.write_row(r, [dcf["scenario"], *yearly[:n_proj]])
+        label_cell.font = LABEL_FONT
+        label_cell.border = THIN_BORDER
+        ws.set_styles(cells, "dcf_value_pct2")
+        ws.set_style(ws.cell(row=r, column=2 + n_proj, value=terminal), "dcf_value_bold_pct2")
 
     # --- Instruction note ---
     row = 39
-    ws.merge_cells(start_row=row, start_column=1, end_row=row + 2, end_column=max_col)
-    note = ws.cell(row=row, column=1,
-                   value="HOW TO USE: Run  python generate_dcf.py <TICKER>  to regenerate this workbook for any stock.\n"
-                         "Examples:  python generate_dcf.py MSFT  |  python generate_dcf.py TSLA  |  python generate_dcf.py GOOGL\n"
-                         "For Alpha Vantage:  python generate_dcf.py AAPL --av-key YOUR_KEY  |  "
-                         "For FRED rates:  python generate_dcf.py AAPL --fred-key YOUR_KEY")
-    note.font = Font(name="Calibri", size=10, italic=True, color="666666")
-    note.alignment = WRAP
+    # One line per row: unmerged text overflows into the empty cells to its right
+    note_lines = (
+        "HOW TO USE: Run  python generate_dcf.py <TICKER>  to regenerate this workbook for any stock.",
+        "Examples:  python generate_dcf.py MSFT  |  python generate_dcf.py TSLA  |  python generate_dcf.py GOOGL",
+        "For Alpha Vantage:  python generate_dcf.py AAPL --av-key YOUR_KEY  |  "
+        "For FRED rates:  python generate_dcf.py AAPL --fred-key YOUR_KEY",
+    )
+    for i, text in enumerate(note_lines):
+        ws.cell(row=row + i, column=1, value=text).font = NOTE_FONT
+
+    if not charts:
+        ws.flush()
+        return
 
     # ===== CHARTS =====
     years = financials["years"]
@@ -434,15 +727,12 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
     cd = 50  # chart data start row
 
     # -- Chart 1: Revenue vs FCF bar chart --
-    ws.cell(row=cd, column=1, value="Year")
-    ws.cell(row=cd + 1, column=1, value="Revenue ($B)")
-    ws.cell(row=cd + 2, column=1, value="Free Cash Flow ($B)")
-    ws.cell(row=cd + 3, column=1, value="Net Income ($B)")
-    for i, yr in enumerate(years):
-        ws.cell(row=cd, column=2 + i, value=yr)
-        ws.cell(row=cd + 1, column=2 + i, value=financials["revenue"][i] / 1e9)
-        ws.cell(row=cd + 2, column=2 + i, value=financials["free_cash_flow"][i] / 1e9)
-        ws.cell(row=cd + 3, column=2 + i, value=financials["net_income"][i] / 1e9)
+    _write_table(ws, cd, [
+        ["Year", *years],
+        ["Revenue ($B)", *_billions(financials["revenue"], n_years)],
+        ["Free Cash Flow ($B)", *_billions(financials["free_cash_flow"], n_years)],
+        ["Net Income ($B)", *_billions(financials["net_income"], n_years)],
+    ])
 
     _make_bar_chart(ws, "Revenue vs FCF vs Net Income ($B)", "$ Billions",
                     [cd + 1, cd + 2, cd + 3], cd, 2, 1 + n_years,
@@ -450,18 +740,14 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
                     "A43", width=28, height=14)
 
     # -- Chart 2: Profitability margins line chart --
-    ws.cell(row=cd + 5, column=1, value="Year")
-    ws.cell(row=cd + 6, column=1, value="Gross Margin")
-    ws.cell(row=cd + 7, column=1, value="Operating Margin")
-    ws.cell(row=cd + 8, column=1, value="Net Margin")
-    ws.cell(row=cd + 9, column=1, value="FCF Margin")
-    for i, yr in enumerate(years):
-        rev = financials["revenue"][i] or 1
-        ws.cell(row=cd + 5, column=2 + i, value=yr)
-        ws.cell(row=cd + 6, column=2 + i, value=financials["gross_profit"][i] / rev)
-        ws.cell(row=cd + 7, column=2 + i, value=financials["operating_income"][i] / rev)
-        ws.cell(row=cd + 8, column=2 + i, value=financials["net_income"][i] / rev)
-        ws.cell(row=cd + 9, column=2 + i, value=financials["free_cash_flow"][i] / rev)
+    revs = financials["revenue"][:n_years]
+    _write_table(ws, cd + 5, [
+        ["Year", *years],
+        ["Gross Margin", *_ratio(financials["gross_profit"][:n_years], revs)],
+        ["Operating Margin", *_ratio(financials["operating_income"][:n_years], revs)],
+        ["Net Margin", *_ratio(financials["net_income"][:n_years], revs)],
+        ["FCF Margin", *_ratio(financials["free_cash_flow"][:n_years], revs)],
+    ])
 
     chart2 = _make_line_chart(ws, "Profitability Margins Over Time", "Margin %",
                               [cd + 6, cd + 7, cd + 8, cd + 9], cd + 5, 2, 1 + n_years,
@@ -470,48 +756,44 @@ def build_dashboard(wb, stock, financials, rates, model_result, data_source):
     chart2.y_axis.numFmt = '0%'
 
     # -- Chart 3: Scenario implied price bar chart --
-    ws.cell(row=cd + 11, column=1, value="Scenario")
-    ws.cell(row=cd + 12, column=1, value="Implied Price ($)")
-    ws.cell(row=cd + 13, column=1, value="Current Price ($)")
-    for i, key in enumerate(scenario_order):
-        dcf = model_result["scenarios"][key]["dcf"]
-        ws.cell(row=cd + 11, column=2 + i, value=dcf["scenario"])
-        ws.cell(row=cd + 12, column=2 + i, value=dcf["implied_share_price"])
-        ws.cell(row=cd + 13, column=2 + i, value=dcf["current_price"])
+    soa = _transpose_scenarios(dcfs, ["scenario", "implied_share_price", "current_price",
+                                      "wacc", "terminal_growth"])
+    _write_table(ws, cd + 11, [
+        ["Scenario", *soa["scenario"]],
+        ["Implied Price ($)", *soa["implied_share_price"]],
+        ["Current Price ($)", *soa["current_price"]],
+    ])
 
     _make_bar_chart(ws, "Implied Share Price by Scenario", "Price ($)",
-                    [cd + 12, cd + 13], cd + 11, 2, 1 + len(scenario_order),
+                    [cd + 12, cd + 13], cd + 11, 2, 1 + len(SCENARIO_ORDER),
                     ["Implied Price", "Current Price"],
                     "A59", width=28, height=14)
 
     # -- Chart 4: WACC components stacked view --
-    ws.cell(row=cd + 15, column=1, value="Scenario")
-    ws.cell(row=cd + 16, column=1, value="WACC (%)")
-    ws.cell(row=cd + 17, column=1, value="Terminal Growth (%)")
-    for i, key in enumerate(scenario_order):
-        dcf = model_result["scenarios"][key]["dcf"]
-        ws.cell(row=cd + 15, column=2 + i, value=dcf["scenario"])
-        ws.cell(row=cd + 16, column=2 + i, value=dcf["wacc"])
-        ws.cell(row=cd + 17, column=2 + i, value=dcf["terminal_growth"])
+    _write_table(ws, cd + 15, [
+        ["Scenario", *soa["scenario"]],
+        ["WACC (%)", *soa["wacc"]],
+        ["Terminal Growth (%)", *soa["terminal_growth"]],
+    ])
 
     chart4 = _make_bar_chart(ws, "WACC vs Terminal Growth by Scenario", "Rate",
-                             [cd + 16, cd + 17], cd + 15, 2, 1 + len(scenario_order),
+                             [cd + 16, cd + 17], cd + 15, 2, 1 + len(SCENARIO_ORDER),
                              ["WACC", "Terminal Growth"],
                              "F59", width=24, height=14)
     chart4.y_axis.numFmt = '0.0%'
 
+    ws.flush()
+
 
 def build_financial_statement_sheet(wb, sheet_name, financials, items, tab_color,
                                     chart_config=None):
     """Generic builder for income statement / balance sheet / cash flow sheets."""
-    ws = wb.create_sheet(title=sheet_name)
+    ws = _new_sheet(wb, sheet_name)
     ws.sheet_properties.tabColor = tab_color
     years = financials["years"]
     max_col = 1 + len(years)
 
-    _set_col_widths(ws, {1: 32})
-    for i in range(2, max_col + 1):
-        ws.column_dimensions[get_column_letter(i)].width = 18
+    _set_col_widths(ws, {1: 32}, rest=18, max_col=max_col)
 
     row = 1
     _write_title_row(ws, row, f"  {sheet_name.upper()}", max_col)
@@ -526,12 +808,11 @@ def build_financial_statement_sheet(wb, sheet_name, financials, items, tab_color
             continue
 
         vals = financials.get(key, [0] * len(years))
-        alt = (row % 2 == 0)
         bold = label.startswith("=")
         if bold:
             label = label[1:]
 
-        _write_data_row(ws, row, label, vals, fmt=fmt, alt=alt,
+        _write_data_row(ws, row, label, vals, fmt=fmt, alt=not row & 1,
                         label_font=BOLD_VALUE if bold else LABEL_FONT,
                         value_font=BOLD_VALUE if bold else VALUE_FONT)
 
@@ -548,18 +829,14 @@ def _add_statement_chart(ws, financials, start_row, config):
     n = len(years)
     cd = start_row + 16  # data area below chart
 
-    ws.cell(row=cd, column=1, value="Year")
-    for i, yr in enumerate(years):
-        ws.cell(row=cd, column=2 + i, value=yr)
+    ws.write_row(cd, ["Year", *years])
 
     data_rows = []
     labels = []
     for offset, (key, label, divisor) in enumerate(config["series"]):
         r = cd + 1 + offset
-        ws.cell(row=r, column=1, value=label)
         vals = financials.get(key, [0] * n)
-        for i, v in enumerate(vals):
-            ws.cell(row=r, column=2 + i, value=(v or 0) / divisor)
+        ws.write_row(r, [label, *_billions(vals, divisor=divisor)])
         data_rows.append(r)
         labels.append(label)
 
@@ -579,7 +856,7 @@ def _add_statement_chart(ws, financials, start_row, config):
     return chart
 
 
-def build_income_statement(wb, financials):
+def build_income_statement(wb, financials, charts=True):
     items = [
         ("INCOME STATEMENT", None, None, True),
         ("Revenue", "revenue", FMT_DOLLAR_B, False),
@@ -603,22 +880,22 @@ def build_income_statement(wb, financials):
         ],
     }
     ws = build_financial_statement_sheet(wb, "Income Statement", financials, items,
-                                         MED_BLUE, chart_cfg)
+                                         MED_BLUE, chart_cfg if charts else None)
+    if not charts:
+        ws.flush()
+        return
 
     # Add margin chart below
     years = financials["years"]
     n = len(years)
     cd2 = 40
-    ws.cell(row=cd2, column=1, value="Year")
-    ws.cell(row=cd2 + 1, column=1, value="Gross Margin")
-    ws.cell(row=cd2 + 2, column=1, value="Operating Margin")
-    ws.cell(row=cd2 + 3, column=1, value="Net Margin")
-    for i, yr in enumerate(years):
-        rev = financials["revenue"][i] or 1
-        ws.cell(row=cd2, column=2 + i, value=yr)
-        ws.cell(row=cd2 + 1, column=2 + i, value=financials["gross_profit"][i] / rev)
-        ws.cell(row=cd2 + 2, column=2 + i, value=financials["operating_income"][i] / rev)
-        ws.cell(row=cd2 + 3, column=2 + i, value=financials["net_income"][i] / rev)
+    revs = financials["revenue"][:n]
+    _write_table(ws, cd2, [
+        ["Year", *years],
+        ["Gross Margin", *_ratio(financials["gross_profit"][:n], revs)],
+        ["Operating Margin", *_ratio(financials["operating_income"][:n], revs)],
+        ["Net Margin", *_ratio(financials["net_income"][:n], revs)],
+    ])
 
     mc = _make_line_chart(ws, "Profit Margins Over Time", "Margin",
                           [cd2 + 1, cd2 + 2, cd2 + 3], cd2, 2, 1 + n,
@@ -626,8 +903,10 @@ def build_income_statement(wb, financials):
                           "D14", width=24, height=14)
     mc.y_axis.numFmt = '0%'
 
+    ws.flush()
 
-def build_balance_sheet(wb, financials):
+
+def build_balance_sheet(wb, financials, charts=True):
     items = [
         ("ASSETS", None, None, True),
         ("Current Assets", "current_assets", FMT_DOLLAR_B, False),
@@ -650,21 +929,20 @@ def build_balance_sheet(wb, financials):
         ],
     }
     ws = build_financial_statement_sheet(wb, "Balance Sheet", financials, items,
-                                         "2E7D32", chart_cfg)
+                                         "2E7D32", chart_cfg if charts else None)
+    if not charts:
+        ws.flush()
+        return
 
     # Add Debt-to-Equity ratio line chart
     years = financials["years"]
     n = len(years)
     cd2 = 42
-    ws.cell(row=cd2, column=1, value="Year")
-    ws.cell(row=cd2 + 1, column=1, value="Debt-to-Equity Ratio")
-    ws.cell(row=cd2 + 2, column=1, value="Current Ratio")
-    for i, yr in enumerate(years):
-        eq = financials["total_equity"][i] or 1
-        cl = financials["current_liabilities"][i] or 1
-        ws.cell(row=cd2, column=2 + i, value=yr)
-        ws.cell(row=cd2 + 1, column=2 + i, value=financials["total_debt"][i] / eq)
-        ws.cell(row=cd2 + 2, column=2 + i, value=financials["current_assets"][i] / cl)
+    _write_table(ws, cd2, [
+        ["Year", *years],
+        ["Debt-to-Equity Ratio", *_ratio(financials["total_debt"][:n], financials["total_equity"][:n])],
+        ["Current Ratio", *_ratio(financials["current_assets"][:n], financials["current_liabilities"][:n])],
+    ])
 
     rc = _make_line_chart(ws, "Key Ratios Over Time", "Ratio",
                           [cd2 + 1, cd2 + 2], cd2, 2, 1 + n,
@@ -672,8 +950,10 @@ def build_balance_sheet(wb, financials):
                           "D13", width=24, height=14)
     rc.y_axis.numFmt = '0.00x'
 
+    ws.flush()
+
 
-def build_cash_flow(wb, financials):
+def build_cash_flow(wb, financials, charts=True):
     items = [
         ("CASH FLOW STATEMENT", None, None, True),
         ("Operating Cash Flow", "operating_cash_flow", FMT_DOLLAR_B, False),
@@ -691,20 +971,21 @@ def build_cash_flow(wb, financials):
         ],
     }
     ws = build_financial_statement_sheet(wb, "Cash Flow", financials, items,
-                                         ACCENT_ORANGE, chart_cfg)
+                                         ACCENT_ORANGE, chart_cfg if charts else None)
+    if not charts:
+        ws.flush()
+        return
 
     # Add FCF conversion chart
     years = financials["years"]
     n = len(years)
     cd2 = 36
-    ws.cell(row=cd2, column=1, value="Year")
-    ws.cell(row=cd2 + 1, column=1, value="FCF Yield (FCF/Revenue)")
-    ws.cell(row=cd2 + 2, column=1, value="CapEx % of Revenue")
-    for i, yr in enumerate(years):
-        rev = financials["revenue"][i] or 1
-        ws.cell(row=cd2, column=2 + i, value=yr)
-        ws.cell(row=cd2 + 1, column=2 + i, value=financials["free_cash_flow"][i] / rev)
-        ws.cell(row=cd2 + 2, column=2 + i, value=abs(financials["capex"][i]) / rev)
+    revs = financials["revenue"][:n]
+    _write_table(ws, cd2, [
+        ["Year", *years],
+        ["FCF Yield (FCF/Revenue)", *_ratio(financials["free_cash_flow"][:n], revs)],
+        ["CapEx % of Revenue", *_ratio(np.abs(financials["capex"][:n]), revs)],
+    ])
 
     fc = _make_line_chart(ws, "FCF Yield & CapEx Intensity", "% of Revenue",
                           [cd2 + 1, cd2 + 2], cd2, 2, 1 + n,
@@ -712,13 +993,21 @@ def build_cash_flow(wb, financials):
                           "D10", width=24, height=14)
     fc.y_axis.numFmt = '0%'
 
+    ws.flush()
+
 
-def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
+def build_wacc_sheet(wb, wacc_data, stock, financials, rates, charts=True):
     """Sheet 5: WACC breakdown with charts."""
-    ws = wb.create_sheet(title="WACC")
+    ws = _new_sheet(wb, "WACC")
     ws.sheet_properties.tabColor = "8E24AA"  # purple
     max_col = 6
 
+    cost_of_debt = wacc_data["cost_of_debt"]
+    tax_rate = wacc_data["tax_rate"]
+    after_tax_cod = cost_of_debt * (1 - tax_rate)
+    equity_value = wacc_data["equity_value"]
+    debt_value = wacc_data["debt_value"]
+
     _set_col_widths(ws, {1: 32, 2: 18, 3: 5, 4: 32, 5: 18, 6: 5})
 
     row = 1
@@ -750,9 +1039,9 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     debt_items = [
         ("Interest Expense", abs(financials["interest_expense"][0]), FMT_DOLLAR_B),
         ("Total Debt", financials["total_debt"][0], FMT_DOLLAR_B),
-        ("Cost of Debt (Rd)", wacc_data["cost_of_debt"], FMT_PCT2),
-        ("Effective Tax Rate (T)", wacc_data["tax_rate"], FMT_PCT2),
-        ("After-Tax Cost of Debt", wacc_data["cost_of_debt"] * (1 - wacc_data["tax_rate"]), FMT_PCT2),
+        ("Cost of Debt (Rd)", cost_of_debt, FMT_PCT2),
+        ("Effective Tax Rate (T)", tax_rate, FMT_PCT2),
+        ("After-Tax Cost of Debt", after_tax_cod, FMT_PCT2),
     ]
     for i, (label, val, fmt) in enumerate(debt_items):
         r = row + 1 + i
@@ -763,9 +1052,9 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     _write_section_header(ws, row, "CAPITAL STRUCTURE", max_col)
 
     cap_items = [
-        ("Market Cap (Equity Value)", wacc_data["equity_value"], FMT_DOLLAR_B),
-        ("Total Debt (Debt Value)", wacc_data["debt_value"], FMT_DOLLAR_B),
-        ("Total Capital (V = E + D)", wacc_data["equity_value"] + wacc_data["debt_value"], FMT_DOLLAR_B),
+        ("Market Cap (Equity Value)", equity_value, FMT_DOLLAR_B),
+        ("Total Debt (Debt Value)", debt_value, FMT_DOLLAR_B),
+        ("Total Capital (V = E + D)", equity_value + debt_value, FMT_DOLLAR_B),
         ("Weight of Equity (E/V)", wacc_data["weight_equity"], FMT_PCT2),
         ("Weight of Debt (D/V)", wacc_data["weight_debt"], FMT_PCT2),
     ]
@@ -778,7 +1067,7 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     _write_section_header(ws, row, "RESULT", max_col)
     row = 26
     _write_kv(ws, row, 1, "WACC", 2, wacc_data["wacc"], FMT_PCT2,
-              label_font=Font(name="Calibri", size=14, bold=True, color=DARK_BLUE),
+              label_font=BIG_NUMBER,
               value_font=BIG_NUMBER)
 
     # Interest Rate Environment
@@ -795,16 +1084,19 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
         r = row + 1 + i
         _write_kv(ws, r, 1, label, 2, val, fmt)
 
+    if not charts:
+        ws.flush()
+        return
+
     # ===== CHARTS =====
 
     # -- Chart 1: Capital Structure Pie Chart --
     cd = 45
-    ws.cell(row=cd, column=1, value="Component")
-    ws.cell(row=cd + 1, column=1, value="Equity")
-    ws.cell(row=cd + 2, column=1, value="Debt")
-    ws.cell(row=cd, column=2, value="Value ($B)")
-    ws.cell(row=cd + 1, column=2, value=wacc_data["equity_value"] / 1e9)
-    ws.cell(row=cd + 2, column=2, value=wacc_data["debt_value"] / 1e9)
+    _write_table(ws, cd, [
+        ["Component", "Value ($B)"],
+        ["Equity", equity_value / 1e9],
+        ["Debt", debt_value / 1e9],
+    ])
 
     pie = PieChart()
     pie.title = "Capital Structure (Equity vs Debt)"
@@ -827,18 +1119,17 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     ws.add_chart(pie, "D5")
 
     # -- Chart 2: WACC Components Bar Chart --
-    ws.cell(row=cd + 4, column=1, value="Component")
-    ws.cell(row=cd + 5, column=1, value="Rate (%)")
     components = [
         ("Risk-Free Rate", wacc_data["risk_free_rate"]),
         ("Cost of Equity", wacc_data["cost_of_equity"]),
-        ("Cost of Debt", wacc_data["cost_of_debt"]),
-        ("After-Tax CoD", wacc_data["cost_of_debt"] * (1 - wacc_data["tax_rate"])),
+        ("Cost of Debt", cost_of_debt),
+        ("After-Tax CoD", after_tax_cod),
         ("WACC", wacc_data["wacc"]),
     ]
-    for j, (name, val) in enumerate(components):
-        ws.cell(row=cd + 4, column=2 + j, value=name)
-        ws.cell(row=cd + 5, column=2 + j, value=val)
+    _write_table(ws, cd + 4, [
+        ["Component", *(name for name, _ in components)],
+        ["Rate (%)", *(val for _, val in components)],
+    ])
 
     chart_w = BarChart()
     chart_w.type = "col"
@@ -857,17 +1148,16 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     ws.add_chart(chart_w, "D19")
 
     # -- Chart 3: Interest Rate Environment Bar --
-    ws.cell(row=cd + 7, column=1, value="Rate")
-    ws.cell(row=cd + 8, column=1, value="Yield (%)")
     rate_bars = [
         ("Fed Funds", rates["fed_funds_rate"]),
         ("2Y Treasury", rates["treasury_2y"]),
         ("10Y Treasury", rates["treasury_10y"]),
         ("WACC", wacc_data["wacc"]),
     ]
-    for j, (name, val) in enumerate(rate_bars):
-        ws.cell(row=cd + 7, column=2 + j, value=name)
-        ws.cell(row=cd + 8, column=2 + j, value=val)
+    _write_table(ws, cd + 7, [
+        ["Rate", *(name for name, _ in rate_bars)],
+        ["Yield (%)", *(val for _, val in rate_bars)],
+    ])
 
     chart_r = BarChart()
     chart_r.type = "col"
@@ -885,36 +1175,97 @@ def build_wacc_sheet(wb, wacc_data, stock, financials, rates):
     _color_series(chart_r)
     ws.add_chart(chart_r, "A35")
 
+    ws.flush()
+
+
+DCF_SHEET_NAMES = {
+    "base": "DCF Base Case", "bull": "DCF Bull Case", "bear": "DCF Bear Case",
+    "rate_hike": "DCF Rising Rates", "rate_cut": "DCF Falling Rates",
+}
+DCF_TAB_COLORS = {
+    "base": MED_BLUE, "bull": ACCENT_GREEN, "bear": ACCENT_RED,
+    "rate_hike": ACCENT_ORANGE, "rate_cut": ACCENT_TEAL,
+}
+
+
+# Historical <-> projected block of a DCF sheet, one entry per row:
+# (row, label, _dcf_sheet_template key, projection key, terminal column,
+#  number format, alt-row fill, bold).  The terminal column is the last
+# projected value grown at g ("grow"), g itself ("g") or carried over ("hold").
+DCF_PROJECTION_PLAN = (
+    (20, "Revenue", "revenue", "projected_revenue", "grow", FMT_DOLLAR_B, False, False),
+    (21, "Revenue Growth %", "growth", "growth_rates", "g", FMT_PCT, True, False),
+    (22, "EBIT (Operating Income)", "ebit", "projected_ebit", "grow", FMT_DOLLAR_B, False, False),
+    (23, "Operating Margin %", "margin", "margins", "hold", FMT_PCT, True, False),
+    (24, "NOPAT (EBIT x (1-T))", "nopat", "projected_nopat", "grow", FMT_DOLLAR_B, False, False),
+    (25, "(+) Depreciation & Amort.", "da", "projected_da", "grow", FMT_DOLLAR_B, True, False),
+    (26, "(-) Capital Expenditure", "capex", "projected_capex", "grow", FMT_DOLLAR_B, False, False),
+    (27, "=Unlevered Free Cash Flow", "fcf", "projected_fcf", "grow", FMT_DOLLAR_B, True, True),
+)
+
+
+def _dcf_sheet_template(model_result, financials):
+    """
+    Layout and historical rows shared by every DCF scenario sheet.
+
+    Only the projected columns differ between scenarios, so the year
+    headers and the historical half of each row (ending in the blank
+    separator column) are built once and reused for all five sheets.
+    """
+    n_proj = model_result["projection_years"]
+    metrics = model_result["metrics"]
+    hist_years = financials["years"]
+    n_hist = len(hist_years)
+    proj_years = _projection_years(financials, n_proj)
+    tax_rate = metrics["tax_rate"]
+
+    def _pad(values):
+        return [*values, *(None,) * (n_hist + 1 - len(values))]
+
+    return {
+        "n_proj": n_proj,
+        "hist_years": hist_years,
+        "proj_years": proj_years,
+        "max_col": 2 + n_hist + n_proj + 1,
+        "header_labels": [""] + hist_years + ["->"] + proj_years + ["Terminal"],
+        "blank": [None] * (n_hist + 1),
+        "revenue": _pad(financials["revenue"]),
+        "revenue_b": _billions(financials["revenue"], n_hist),
+        "growth": _pad(metrics["revenue_growths"]),
+        "ebit": _pad(financials["operating_income"]),
+        "margin": _pad(metrics["operating_margins"]),
+        "nopat": _pad((np.asarray(financials["operating_income"][:n_hist], dtype=np.float64)
+                       * (1 - tax_rate)).tolist()),
+        "da": _pad(financials["depreciation"]),
+        "capex": _pad(np.abs(financials["capex"]).tolist()),
+        "fcf": _pad(financials["free_cash_flow"]),
+    }
+
+
+def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock,
+                             template=None, charts=True):
+    """
+    Build a detailed DCF sheet for one scenario with projection charts.
 
-def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
-    """Build a detailed DCF sheet for one scenario with projection charts."""
+    *template* is the _dcf_sheet_template() for this model; build_workbook
+    passes one in so the five scenario sheets share it.
+    """
     sc_data = model_result["scenarios"][scenario_key]
     scenario = sc_data["scenario"]
     proj = sc_data["projection"]
     dcf = sc_data["dcf"]
-    wacc_data = model_result["wacc_data"]
-
-    tab_colors = {
-        "base": MED_BLUE, "bull": ACCENT_GREEN, "bear": ACCENT_RED,
-        "rate_hike": ACCENT_ORANGE, "rate_cut": ACCENT_TEAL,
-    }
-    sheet_names = {
-        "base": "DCF Base Case", "bull": "DCF Bull Case", "bear": "DCF Bear Case",
-        "rate_hike": "DCF Rising Rates", "rate_cut": "DCF Falling Rates",
-    }
+    t = template or _dcf_sheet_template(model_result, financials)
 
-    ws = wb.create_sheet(title=sheet_names[scenario_key])
-    ws.sheet_properties.tabColor = tab_colors.get(scenario_key, MED_BLUE)
+    ws = _new_sheet(wb, DCF_SHEET_NAMES[scenario_key])
+    ws.sheet_properties.tabColor = DCF_TAB_COLORS.get(scenario_key, MED_BLUE)
 
-    n_proj = proj["projection_years"]
-    hist_years = financials["years"]
-    proj_years = [str(int(hist_years[0]) + i + 1) for i in range(n_proj)]
-    all_years = hist_years + [""] + proj_years + ["Terminal"]
-    max_col = 1 + len(all_years)
+    n_proj = t["n_proj"]
+    hist_years = t["hist_years"]
+    proj_years = t["proj_years"]
+    max_col = t["max_col"]
+    blank = t["blank"]
 
-    _set_col_widths(ws, {1: 30})
-    for i in range(2, max_col + 1):
-        ws.column_dimensions[get_column_letter(i)].width = 16
+    _set_col_widths(ws, {1: 30}, rest=16, max_col=max_col)
 
     # Title
     row = 1
@@ -922,9 +1273,9 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
     row = 2
     ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=max_col)
     cell = ws.cell(row=row, column=1, value=f"  {scenario.description}")
-    cell.font = Font(name="Calibri", size=10, italic=True, color=LIGHT_BLUE)
+    cell.font = SUBTITLE_ITALIC_FONT
     cell.fill = TITLE_FILL
-    ws.row_dimensions[row].height = 22
+    ws.set_height(row, 22)
 
     # Scenario adjustments
     row = 4
@@ -953,7 +1304,7 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
 
     row = 15
     _write_data_row(ws, row, "Rate Change (bp/yr)",
-                    [None] * len(hist_years) + [None] + rate_path_bp + [0],
+                    [*blank, *rate_path_bp, 0],
                     fmt='0', start_col=1)
     # Replace: only write the projection columns for rate path
     cell = ws.cell(row=row, column=1, value="Rate Change (bp/yr)")
@@ -967,107 +1318,51 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
         c.number_format = '+0;-0;0'
 
     row = 16
-    cell = ws.cell(row=row, column=1, value="WACC (%)")
-    cell.font = BOLD_VALUE
-    cell.border = THIN_BORDER
-    for j, w in enumerate(yearly_waccs[:n_proj]):
-        c = ws.cell(row=row, column=2 + j, value=w)
-        c.font = BOLD_VALUE
-        c.alignment = RIGHT
-        c.border = THIN_BORDER
-        c.number_format = FMT_PCT2
-    c = ws.cell(row=row, column=2 + n_proj, value=dcf.get("terminal_wacc", dcf["wacc"]))
-    c.font = BOLD_VALUE
-    c.alignment = RIGHT
-    c.border = THIN_BORDER
-    c.number_format = FMT_PCT2
+    label_cell, *cells = ws.write_row(row, ["WACC (%)", *yearly_waccs[:n_proj]])
+    label_cell.font = BOLD_VALUE
+    label_cell.border = THIN_BORDER
+    cells.append(ws.cell(row=row, column=2 + n_proj, value=dcf.get("terminal_wacc", dcf["wacc"])))
+    ws.set_styles(cells, "dcf_value_bold_pct2")
 
     # Historical + Projected FCF
     row = 18
     _write_section_header(ws, row, "HISTORICAL  <-->  PROJECTED", max_col)
 
     row = 19
-    header_labels = [""] + hist_years + ["->"] + proj_years + ["Terminal"]
-    _write_header_row(ws, row, header_labels)
+    _write_header_row(ws, row, t["header_labels"])
+
+    # Terminal column: each line's final projected year grown once at g
+    g = dcf["terminal_growth"]
+    tg1 = 1 + g
+    terminal = {"grow": lambda vals: vals[-1] * tg1,
+                "g": lambda vals: g,
+                "hold": lambda vals: vals[-1]}
+    for r, label, key, proj_key, term, fmt, alt, bold in DCF_PROJECTION_PLAN:
+        proj_vals = proj[proj_key]
+        font = BOLD_VALUE if bold else None
+        _write_data_row(ws, r, label, [*t[key], *proj_vals, terminal[term](proj_vals)],
+                        fmt=fmt, alt=alt,
+                        label_font=font or LABEL_FONT, value_font=font or VALUE_FONT)
 
-    # Revenue
-    row = 20
-    hist_rev = financials["revenue"]
     proj_rev = proj["projected_revenue"]
-    term_rev = proj_rev[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "Revenue", hist_rev + [None] + proj_rev + [term_rev], fmt=FMT_DOLLAR_B)
-
-    # Growth Rate
-    row = 21
-    hist_growths = model_result["metrics"]["revenue_growths"]
-    proj_growths = proj["growth_rates"]
-    growth_vals = hist_growths + [None] * (len(hist_years) - len(hist_growths)) + [None] + proj_growths + [dcf["terminal_growth"]]
-    _write_data_row(ws, row, "Revenue Growth %", growth_vals, fmt=FMT_PCT, alt=True)
-
-    # Operating Income / EBIT
-    row = 22
-    hist_ebit = financials["operating_income"]
-    proj_ebit = proj["projected_ebit"]
-    term_ebit = proj_ebit[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "EBIT (Operating Income)", hist_ebit + [None] + proj_ebit + [term_ebit], fmt=FMT_DOLLAR_B)
-
-    # Operating Margin
-    row = 23
-    hist_margins = model_result["metrics"]["operating_margins"]
-    proj_margins = proj["margins"]
-    margin_vals = hist_margins + [None] * (len(hist_years) - len(hist_margins)) + [None] + proj_margins + [proj_margins[-1]]
-    _write_data_row(ws, row, "Operating Margin %", margin_vals, fmt=FMT_PCT, alt=True)
-
-    # NOPAT
-    row = 24
-    hist_nopat = [financials["operating_income"][i] * (1 - proj["tax_rate"]) for i in range(len(hist_years))]
-    proj_nopat = proj["projected_nopat"]
-    term_nopat = proj_nopat[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "NOPAT (EBIT x (1-T))", hist_nopat + [None] + proj_nopat + [term_nopat], fmt=FMT_DOLLAR_B)
-
-    # D&A
-    row = 25
-    hist_da = financials["depreciation"]
-    proj_da = proj["projected_da"]
-    term_da = proj_da[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "(+) Depreciation & Amort.", hist_da + [None] + proj_da + [term_da], fmt=FMT_DOLLAR_B, alt=True)
-
-    # CapEx
-    row = 26
-    hist_capex = [abs(c) for c in financials["capex"]]
-    proj_capex = proj["projected_capex"]
-    term_capex = proj_capex[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "(-) Capital Expenditure", hist_capex + [None] + proj_capex + [term_capex], fmt=FMT_DOLLAR_B)
-
-    # FCF
-    row = 27
-    hist_fcf = financials["free_cash_flow"]
     proj_fcf = proj["projected_fcf"]
-    term_fcf = proj_fcf[-1] * (1 + dcf["terminal_growth"])
-    _write_data_row(ws, row, "=Unlevered Free Cash Flow",
-                    hist_fcf + [None] + proj_fcf + [term_fcf],
-                    fmt=FMT_DOLLAR_B, label_font=BOLD_VALUE, value_font=BOLD_VALUE, alt=True)
 
     # PV of FCFs
     row = 29
     _write_section_header(ws, row, "PRESENT VALUE CALCULATION", max_col)
 
     row = 30
-    pv_vals = [None] * len(hist_years) + [None] + dcf["pv_fcfs"] + [dcf["pv_terminal_value"]]
+    pv_vals = [*blank, *dcf["pv_fcfs"], dcf["pv_terminal_value"]]
     _write_data_row(ws, row, "PV of Free Cash Flow", pv_vals, fmt=FMT_DOLLAR_B)
 
     row = 31
-    yearly_waccs = dcf.get("yearly_waccs", [dcf["wacc"]] * n_proj)
-    cum_disc = 1.0
-    disc_factors = [None] * len(hist_years) + [None]
-    for i in range(n_proj):
-        cum_disc *= (1 + yearly_waccs[i])
-        disc_factors.append(1.0 / cum_disc)
-    disc_factors.append(1.0 / cum_disc)
+    discount = (dcf.get("discount_factors")
+                or (1.0 / np.cumprod([1 + w for w in yearly_waccs[:n_proj]])).tolist())
+    disc_factors = [*blank, *discount, discount[-1] if discount else 1.0]
     _write_data_row(ws, row, "Discount Factor", disc_factors, fmt="0.0000", alt=True)
 
     row = 32
-    wacc_row_vals = [None] * len(hist_years) + [None] + yearly_waccs[:n_proj] + [dcf.get("terminal_wacc", dcf["wacc"])]
+    wacc_row_vals = [*blank, *yearly_waccs[:n_proj], dcf.get("terminal_wacc", dcf["wacc"])]
     _write_data_row(ws, row, "WACC (Year-by-Year)", wacc_row_vals, fmt=FMT_PCT2)
 
     # Valuation Bridge
@@ -1086,22 +1381,24 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
         ("Current Market Price", dcf["current_price"], FMT_PRICE),
         ("Upside / Downside", dcf["upside_downside"], FMT_PCT),
     ]
+    bridge_cells = []
     for i, (label, val, fmt) in enumerate(bridge_items):
         r = row + 1 + i
         bold = label.startswith("=")
         lbl = label.lstrip("= ")
-        _write_kv(ws, r, 1, lbl, 2, val, fmt,
-                  label_font=BOLD_VALUE if bold else LABEL_FONT,
-                  value_font=BOLD_VALUE if bold else VALUE_FONT)
+        _, value_cell = _write_kv(ws, r, 1, lbl, 2, val, fmt,
+                                  label_font=BOLD_VALUE if bold else LABEL_FONT,
+                                  value_font=BOLD_VALUE if bold else VALUE_FONT)
+        bridge_cells.append(value_cell)
 
     # Color implied price
-    price_cell = ws.cell(row=row + 8, column=2)
+    price_cell = bridge_cells[7]
     if dcf["upside_downside"] > 0:
-        price_cell.font = Font(name="Calibri", size=14, bold=True, color=ACCENT_GREEN)
+        price_cell.font = BIG_GREEN_FONT
     else:
-        price_cell.font = Font(name="Calibri", size=14, bold=True, color=ACCENT_RED)
+        price_cell.font = BIG_RED_FONT
 
-    ud_cell = ws.cell(row=row + 10, column=2)
+    ud_cell = bridge_cells[9]
     if dcf["upside_downside"] > 0:
         ud_cell.font = GREEN_FONT
         ud_cell.fill = GREEN_FILL
@@ -1109,24 +1406,24 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
         ud_cell.font = RED_FONT
         ud_cell.fill = RED_FILL
 
+    if not charts:
+        ws.flush()
+        return
+
     # ===== CHARTS =====
     combined_years = hist_years + proj_years
     n_all = len(combined_years)
     cd = 50
 
     # -- Chart 1: Revenue Projection (Historical + Projected) --
-    ws.cell(row=cd, column=1, value="Year")
-    ws.cell(row=cd + 1, column=1, value="Historical Revenue ($B)")
-    ws.cell(row=cd + 2, column=1, value="Projected Revenue ($B)")
-    for i, yr in enumerate(hist_years):
-        ws.cell(row=cd, column=2 + i, value=yr)
-        ws.cell(row=cd + 1, column=2 + i, value=hist_rev[i] / 1e9)
-        ws.cell(row=cd + 2, column=2 + i, value=None)  # blank projected for hist
-    for i, yr in enumerate(proj_years):
-        col = 2 + len(hist_years) + i
-        ws.cell(row=cd, column=col, value=yr)
-        ws.cell(row=cd + 1, column=col, value=None)  # blank historical for proj
-        ws.cell(row=cd + 2, column=col, value=proj_rev[i] / 1e9)
+    # Historical and projected revenue as two series, each blank where the
+    # other has values
+    n_hist = len(hist_years)
+    _write_table(ws, cd, [
+        ["Year", *hist_years, *proj_years],
+        ["Historical Revenue ($B)", *t["revenue_b"], *[None] * n_proj],
+        ["Projected Revenue ($B)", *[None] * n_hist, *_billions(proj_rev, n_proj)],
+    ])
 
     chart1 = BarChart()
     chart1.type = "col"
@@ -1147,13 +1444,11 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
     ws.add_chart(chart1, "D4")
 
     # -- Chart 2: FCF Projection with PV overlay --
-    ws.cell(row=cd + 4, column=1, value="Year")
-    ws.cell(row=cd + 5, column=1, value="Projected FCF ($B)")
-    ws.cell(row=cd + 6, column=1, value="PV of FCF ($B)")
-    for i, yr in enumerate(proj_years):
-        ws.cell(row=cd + 4, column=2 + i, value=yr)
-        ws.cell(row=cd + 5, column=2 + i, value=proj_fcf[i] / 1e9)
-        ws.cell(row=cd + 6, column=2 + i, value=dcf["pv_fcfs"][i] / 1e9)
+    _write_table(ws, cd + 4, [
+        ["Year", *proj_years],
+        ["Projected FCF ($B)", *_billions(proj_fcf, n_proj)],
+        ["PV of FCF ($B)", *_billions(dcf["pv_fcfs"], n_proj)],
+    ])
 
     _make_bar_chart(ws, f"FCF vs Present Value — {scenario.name} ($B)", "$ Billions",
                     [cd + 5, cd + 6], cd + 4, 2, 1 + n_proj,
@@ -1161,8 +1456,6 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
                     "D27", width=28, height=14)
 
     # -- Chart 3: Valuation Bridge Waterfall --
-    ws.cell(row=cd + 8, column=1, value="Step")
-    ws.cell(row=cd + 9, column=1, value="Value ($B)")
     bridge_chart_data = [
         ("PV of FCFs", dcf["pv_fcf_total"] / 1e9),
         ("PV Terminal", dcf["pv_terminal_value"] / 1e9),
@@ -1170,19 +1463,22 @@ def build_dcf_scenario_sheet(wb, scenario_key, model_result, financials, stock):
         ("(-) Net Debt", -dcf["net_debt"] / 1e9),
         ("Equity Value", dcf["equity_value"] / 1e9),
     ]
-    for j, (label, val) in enumerate(bridge_chart_data):
-        ws.cell(row=cd + 8, column=2 + j, value=label)
-        ws.cell(row=cd + 9, column=2 + j, value=val)
+    _write_table(ws, cd + 8, [
+        ["Step", *(label for label, _ in bridge_chart_data)],
+        ["Value ($B)", *(val for _, val in bridge_chart_data)],
+    ])
 
     _make_bar_chart(ws, f"Valuation Bridge — {scenario.name} ($B)", "$ Billions",
                     [cd + 9], cd + 8, 2, 1 + len(bridge_chart_data),
                     ["Value"],
                     "A39", width=28, height=14)
 
+    ws.flush()
+
 
-def build_scenario_comparison(wb, model_result, stock, financials):
+def build_scenario_comparison(wb, model_result, stock, financials, charts=True):
     """Sheet 11: Side-by-side comparison of all scenarios with multiple charts."""
-    ws = wb.create_sheet(title="Scenario Comparison")
+    ws = _new_sheet(wb, "Scenario Comparison")
     ws.sheet_properties.tabColor = "6A1B9A"  # deep purple
     max_col = 7
 
@@ -1191,12 +1487,6 @@ def build_scenario_comparison(wb, model_result, stock, financials):
     row = 1
     _write_title_row(ws, row, "  SCENARIO COMPARISON  —  ALL PATHS", max_col)
 
-    scenario_order = ["bull", "base", "bear", "rate_hike", "rate_cut"]
-    names = [model_result["scenarios"][k]["dcf"]["scenario"] for k in scenario_order]
-
-    row = 3
-    _write_header_row(ws, row, ["Metric"] + names + [""])
-
     comparison_rows = [
         ("WACC", "wacc", FMT_PCT2),
         ("Terminal Growth", "terminal_growth", FMT_PCT2),
@@ -1209,18 +1499,23 @@ def build_scenario_comparison(wb, model_result, stock, financials):
         ("Current Price", "current_price", FMT_PRICE),
         ("Upside / Downside", "upside_downside", FMT_PCT),
     ]
+    # Each scenario's results, resolved once for every table and chart below
+    scns = tuple(model_result["scenarios"][key] for key in SCENARIO_ORDER)
+    soa = _transpose_scenarios([scn["dcf"] for scn in scns],
+                               ["scenario", *(key for _, key, _ in comparison_rows)])
+
+    row = 3
+    _write_header_row(ws, row, ["Metric"] + soa["scenario"] + [""])
 
     for i, (label, key, fmt) in enumerate(comparison_rows):
         r = row + 1 + i
-        alt = i % 2 == 1
-        vals = [model_result["scenarios"][k]["dcf"][key] for k in scenario_order]
-        _write_data_row(ws, r, label, vals, fmt=fmt, alt=alt,
+        _write_data_row(ws, r, label, soa[key], fmt=fmt, alt=i & 1,
                         label_font=BOLD_VALUE if "Implied" in label or "Upside" in label else LABEL_FONT,
                         value_font=BOLD_VALUE if "Implied" in label or "Upside" in label else VALUE_FONT)
 
     # Color upside/downside row
     ud_row = row + len(comparison_rows)
-    for j in range(len(scenario_order)):
+    for j in range(len(SCENARIO_ORDER)):
         cell = ws.cell(row=ud_row, column=2 + j)
         if cell.value and cell.value > 0:
             cell.font = GREEN_FONT
@@ -1232,15 +1527,13 @@ def build_scenario_comparison(wb, model_result, stock, financials):
     # Scenario Descriptions
     row = ud_row + 2
     _write_section_header(ws, row, "SCENARIO DESCRIPTIONS", max_col)
-    for i, key in enumerate(scenario_order):
+    for i, sc in enumerate(scn["scenario"] for scn in scns):
         r = row + 1 + i
-        sc = model_result["scenarios"][key]["scenario"]
         ws.cell(row=r, column=1, value=sc.name).font = BOLD_VALUE
         ws.cell(row=r, column=2, value=sc.description).font = LABEL_FONT
-        ws.merge_cells(start_row=r, start_column=2, end_row=r, end_column=max_col)
 
     # Interest Rate Path Explanation
-    row = ud_row + 2 + len(scenario_order) + 2
+    row = ud_row + 2 + len(SCENARIO_ORDER) + 2
     _write_section_header(ws, row, "INTEREST RATE PATH ANALYSIS", max_col)
 
     rate_notes = [
@@ -1255,22 +1548,22 @@ def build_scenario_comparison(wb, model_result, stock, financials):
         r = row + 1 + i
         ws.cell(row=r, column=1, value=title).font = BOLD_VALUE
         ws.cell(row=r, column=2, value=note).font = SMALL_FONT
-        ws.merge_cells(start_row=r, start_column=2, end_row=r, end_column=max_col)
+
+    if not charts:
+        ws.flush()
+        return
 
     # ===== CHARTS =====
     chart_start = row + len(rate_notes) + 2
     cd = chart_start + 60  # data area well below charts
-    ns = len(scenario_order)
+    ns = len(SCENARIO_ORDER)
 
     # -- Chart 1: Implied Price vs Current Price --
-    ws.cell(row=cd, column=1, value="Scenario")
-    ws.cell(row=cd + 1, column=1, value="Implied Price ($)")
-    ws.cell(row=cd + 2, column=1, value="Current Price ($)")
-    for i, key in enumerate(scenario_order):
-        dcf = model_result["scenarios"][key]["dcf"]
-        ws.cell(row=cd, column=2 + i, value=dcf["scenario"])
-        ws.cell(row=cd + 1, column=2 + i, value=dcf["implied_share_price"])
-        ws.cell(row=cd + 2, column=2 + i, value=dcf["current_price"])
+    _write_table(ws, cd, [
+        ["Scenario", *soa["scenario"]],
+        ["Implied Price ($)", *soa["implied_share_price"]],
+        ["Current Price ($)", *soa["current_price"]],
+    ])
 
     _make_bar_chart(ws, "Implied Share Price vs Current Price by Scenario", "Price ($)",
                     [cd + 1, cd + 2], cd, 2, 1 + ns,
@@ -1278,14 +1571,11 @@ def build_scenario_comparison(wb, model_result, stock, financials):
                     f"A{chart_start}", width=28, height=14)
 
     # -- Chart 2: Enterprise Value Comparison --
-    ws.cell(row=cd + 4, column=1, value="Scenario")
-    ws.cell(row=cd + 5, column=1, value="PV of FCFs ($B)")
-    ws.cell(row=cd + 6, column=1, value="PV of Terminal Value ($B)")
-    for i, key in enumerate(scenario_order):
-        dcf = model_result["scenarios"][key]["dcf"]
-        ws.cell(row=cd + 4, column=2 + i, value=dcf["scenario"])
-        ws.cell(row=cd + 5, column=2 + i, value=dcf["pv_fcf_total"] / 1e9)
-        ws.cell(row=cd + 6, column=2 + i, value=dcf["pv_terminal_value"] / 1e9)
+    _write_table(ws, cd + 4, [
+        ["Scenario", *soa["scenario"]],
+        ["PV of FCFs ($B)", *_billions(soa["pv_fcf_total"])],
+        ["PV of Terminal Value ($B)", *_billions(soa["pv_terminal_value"])],
+    ])
 
     chart_ev = BarChart()
     chart_ev.type = "col"
@@ -1307,14 +1597,11 @@ def build_scenario_comparison(wb, model_result, stock, financials):
     ws.add_chart(chart_ev, f"A{chart_start + 15}")
 
     # -- Chart 3: WACC by Scenario --
-    ws.cell(row=cd + 8, column=1, value="Scenario")
-    ws.cell(row=cd + 9, column=1, value="WACC (%)")
-    ws.cell(row=cd + 10, column=1, value="Terminal Growth (%)")
-    for i, key in enumerate(scenario_order):
-        dcf = model_result["scenarios"][key]["dcf"]
-        ws.cell(row=cd + 8, column=2 + i, value=dcf["scenario"])
-        ws.cell(row=cd + 9, column=2 + i, value=dcf["wacc"])
-        ws.cell(row=cd + 10, column=2 + i, value=dcf["terminal_growth"])
+    _write_table(ws, cd + 8, [
+        ["Scenario", *soa["scenario"]],
+        ["WACC (%)", *soa["wacc"]],
+        ["Terminal Growth (%)", *soa["terminal_growth"]],
+    ])
 
     chart_wacc = BarChart()
     chart_wacc.type = "col"
@@ -1336,22 +1623,15 @@ def build_scenario_comparison(wb, model_result, stock, financials):
     ws.add_chart(chart_wacc, f"A{chart_start + 30}")
 
     # -- Chart 4: FCF Projection Across All Scenarios (Line) --
-    proj_years = [str(int(financials["years"][0]) + i + 1) for i in range(model_result["projection_years"])]
+    proj_years = _projection_years(financials, model_result["projection_years"])
     n_proj = len(proj_years)
-    ws.cell(row=cd + 12, column=1, value="Year")
-    for j, yr in enumerate(proj_years):
-        ws.cell(row=cd + 12, column=2 + j, value=yr)
-
-    data_rows_fcf = []
-    labels_fcf = []
-    for si, key in enumerate(scenario_order):
-        r = cd + 13 + si
-        scn = model_result["scenarios"][key]
-        ws.cell(row=r, column=1, value=scn["dcf"]["scenario"])
-        for j, fcf_val in enumerate(scn["projection"]["projected_fcf"]):
-            ws.cell(row=r, column=2 + j, value=fcf_val / 1e9)
-        data_rows_fcf.append(r)
-        labels_fcf.append(scn["dcf"]["scenario"])
+    labels_fcf = [scn["dcf"]["scenario"] for scn in scns]
+    data_rows_fcf = [cd + 13 + si for si in range(ns)]
+    _write_table(ws, cd + 12, [
+        ["Year", *proj_years],
+        *([scn["dcf"]["scenario"], *_billions(scn["projection"]["projected_fcf"])]
+          for scn in scns),
+    ])
 
     chart_fcf_all = _make_line_chart(
         ws, "Projected FCF Across All Scenarios ($B)", "$ Billions",
@@ -1359,36 +1639,91 @@ def build_scenario_comparison(wb, model_result, stock, financials):
         f"A{chart_start + 45}", width=28, height=14)
 
     # -- Chart 5: Revenue Projection Across All Scenarios (Line) --
-    ws.cell(row=cd + 19, column=1, value="Year")
-    for j, yr in enumerate(proj_years):
-        ws.cell(row=cd + 19, column=2 + j, value=yr)
-
-    data_rows_rev = []
-    labels_rev = []
-    for si, key in enumerate(scenario_order):
-        r = cd + 20 + si
-        scn = model_result["scenarios"][key]
-        ws.cell(row=r, column=1, value=scn["dcf"]["scenario"])
-        for j, rev_val in enumerate(scn["projection"]["projected_revenue"]):
-            ws.cell(row=r, column=2 + j, value=rev_val / 1e9)
-        data_rows_rev.append(r)
-        labels_rev.append(scn["dcf"]["scenario"])
+    labels_rev = labels_fcf
+    data_rows_rev = [cd + 20 + si for si in range(ns)]
+    _write_table(ws, cd + 19, [
+        ["Year", *proj_years],
+        *([scn["dcf"]["scenario"], *_billions(scn["projection"]["projected_revenue"])]
+          for scn in scns),
+    ])
 
     _make_line_chart(
         ws, "Projected Revenue Across All Scenarios ($B)", "$ Billions",
         data_rows_rev, cd + 19, 2, 1 + n_proj, labels_rev,
         f"E{chart_start + 45}", width=28, height=14)
 
+    ws.flush()
 
-def build_sensitivity(wb, model_result, stock, financials):
+
+# Sensitivity axes as offsets from the base-case value (the 0 entry)
+WACC_OFFSETS = np.array([-0.03, -0.02, -0.01, 0, 0.01, 0.02, 0.03])
+TG_OFFSETS = np.array([-0.015, -0.01, -0.005, 0, 0.005, 0.01, 0.015])
+GROWTH_OFFSETS = np.array([-0.04, -0.02, 0, 0.02, 0.04, 0.06])
+MARGIN_OFFSETS = np.array([-0.04, -0.02, 0, 0.02, 0.04])
+
+
+def _compute_sensitivity_tables(model_result, stock, financials):
+    """
+    Price both sensitivity tables ahead of any cell writes.  Returns the
+    axis values and the WACC x terminal growth and revenue growth x operating
+    margin price grids as float64 arrays, plus each grid's per-cell style
+    names.
+    """
+    base_wacc = model_result["wacc_data"]["wacc"]
+    base_tg = model_result["terminal_growth"]
+    base_dcf = model_result["scenarios"]["base"]["dcf"]
+    base_projection = model_result["scenarios"]["base"]["projection"]
+    base_metrics = model_result["metrics"]
+    n_proj = model_result["projection_years"]
+    net_debt = float(base_dcf["net_debt"])
+    shares = float(stock["shares_outstanding"])
+    current_price = stock["current_price"]
+
+    # Terminal growth rates (columns) and WACCs (rows)
+    tg_range = np.maximum(base_tg + TG_OFFSETS, 0.005)
+    wacc_range = np.maximum(base_wacc + WACC_OFFSETS, 0.04)
+
+    # Priced from the base-case FCF projection
+    wacc_tg = sensitivity_grid(wacc_range, tg_range,
+                               np.asarray(base_projection["projected_fcf"], dtype=np.float64),
+                               net_debt, shares)
+
+    growth_range = base_metrics["avg_revenue_growth"] + GROWTH_OFFSETS
+    margin_range = base_metrics["avg_operating_margin"] + MARGIN_OFFSETS
+    growth_margin = growth_margin_grid(
+        float(financials["revenue"][0]), growth_range,
+        margin_range, float(base_projection["tax_rate"]),
+        float(base_metrics["avg_da_pct"]), float(base_metrics["avg_capex_pct"]),
+        float(base_wacc), float(base_tg), int(n_proj), net_debt, shares)
+
+    return {
+        "base_wacc": base_wacc,
+        "base_tg": base_tg,
+        "wacc_range": wacc_range,
+        "tg_range": tg_range,
+        "wacc_tg": wacc_tg,
+        "wacc_tg_styles": _band_styles(wacc_tg, current_price, SENSITIVITY_BANDS),
+        "growth_range": growth_range,
+        "margin_range": margin_range,
+        "growth_margin": growth_margin,
+        "growth_margin_styles": _band_styles(growth_margin, current_price, GROWTH_MARGIN_BANDS),
+    }
+
+
+def build_sensitivity(wb, model_result, stock, financials, charts=True):
     """Sheet 12: WACC vs Terminal Growth sensitivity table."""
-    ws = wb.create_sheet(title="Sensitivity Analysis")
+    ws = _new_sheet(wb, "Sensitivity Analysis")
     ws.sheet_properties.tabColor = "00695C"  # teal
     max_col = 12
 
-    _set_col_widths(ws, {1: 24})
-    for i in range(2, max_col + 1):
-        ws.column_dimensions[get_column_letter(i)].width = 14
+    _set_col_widths(ws, {1: 24}, rest=14, max_col=max_col)
+
+    # All pricing and classification happens here; the rest only writes
+    tables = _compute_sensitivity_tables(model_result, stock, financials)
+    base_wacc, base_tg = tables["base_wacc"], tables["base_tg"]
+    wacc_range, tg_range = tables["wacc_range"].tolist(), tables["tg_range"].tolist()
+    growth_range, margin_range = tables["growth_range"].tolist(), tables["margin_range"].tolist()
+    wacc_tg = tables["wacc_tg"]
 
     row = 1
     _write_title_row(ws, row, "  SENSITIVITY ANALYSIS  —  IMPLIED SHARE PRICE", max_col)
@@ -1396,90 +1731,26 @@ def build_sensitivity(wb, model_result, stock, financials):
     row = 3
     _write_section_header(ws, row, "WACC vs TERMINAL GROWTH RATE", max_col)
 
-    base_wacc = model_result["wacc_data"]["wacc"]
-    base_tg = model_result["terminal_growth"]
-    base_dcf = model_result["scenarios"]["base"]["dcf"]
-
-    # Terminal growth rates (columns)
-    tg_range = [base_tg + delta for delta in [-0.015, -0.01, -0.005, 0, 0.005, 0.01, 0.015]]
-    tg_range = [max(tg, 0.005) for tg in tg_range]
-
-    # WACC range (rows)
-    wacc_range = [base_wacc + delta for delta in [-0.03, -0.02, -0.01, 0, 0.01, 0.02, 0.03]]
-    wacc_range = [max(w, 0.04) for w in wacc_range]
-
     # Header row
     row = 4
-    ws.cell(row=row, column=1, value="WACC \\ Terminal Growth").font = HEADER_FONT
-    ws.cell(row=row, column=1).fill = HEADER_FILL
-    ws.cell(row=row, column=1).alignment = CENTER
-    ws.cell(row=row, column=1).border = THIN_BORDER
-    for j, tg in enumerate(tg_range):
-        cell = ws.cell(row=row, column=2 + j, value=tg)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
+    _, *tg_cells = _write_header_row(ws, row, ["WACC \\ Terminal Growth", *tg_range])
+    for cell in tg_cells:
         cell.number_format = FMT_PCT2
 
-    # Use the last projected FCF from base case for sensitivity
-    last_fcf = model_result["scenarios"]["base"]["projection"]["projected_fcf"][-1]
-    n_proj = model_result["projection_years"]
-    net_debt = base_dcf["net_debt"]
-    shares = stock["shares_outstanding"]
+    # The WACC range is centred on the base WACC
+    base_idx = len(wacc_range) // 2
 
-    for i, wacc in enumerate(wacc_range):
+    # NaN marks WACC <= g, where the Gordon growth value is undefined
+    rows = [["N/A" if price != price else price for price in prices] for prices in wacc_tg.tolist()]
+    for i, (wacc, row_vals, styles) in enumerate(zip(wacc_range, rows, tables["wacc_tg_styles"])):
         r = row + 1 + i
-        alt = i % 2 == 1
-
-        # WACC label
-        cell = ws.cell(row=r, column=1, value=wacc)
-        cell.font = BOLD_VALUE
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
-        cell.number_format = FMT_PCT2
-        if alt:
-            cell.fill = ALT_ROW_FILL
-
-        for j, tg in enumerate(tg_range):
-            if wacc <= tg:
-                val = "N/A"
-                cell = ws.cell(row=r, column=2 + j, value=val)
-            else:
-                proj_fcfs = model_result["scenarios"]["base"]["projection"]["projected_fcf"]
-                new_pv_fcfs = sum(fcf / (1 + wacc) ** (k + 1) for k, fcf in enumerate(proj_fcfs))
-
-                term_fcf = last_fcf * (1 + tg)
-                term_val = term_fcf / (wacc - tg)
-                pv_term = term_val / (1 + wacc) ** n_proj
-                ev = new_pv_fcfs + pv_term
-                eq_val = ev - net_debt
-                price = eq_val / shares if shares > 0 else 0
-
-                cell = ws.cell(row=r, column=2 + j, value=price)
-                cell.number_format = FMT_PRICE
-
-                if price > stock["current_price"] * 1.1:
-                    cell.fill = GREEN_FILL
-                    cell.font = GREEN_FONT
-                elif price < stock["current_price"] * 0.9:
-                    cell.fill = RED_FILL
-                    cell.font = RED_FONT
-                else:
-                    cell.font = VALUE_FONT
-
-            cell.alignment = CENTER
-            cell.border = THIN_BORDER
+        label_cell, *cells = ws.write_row(r, [wacc, *row_vals])
+        ws.set_style(label_cell, "dcf_grid_axis_pct2_alt" if i & 1 else "dcf_grid_axis_pct2")
 
         # Highlight the base case row
-        if abs(wacc - base_wacc) < 0.001:
-            for j in range(len(tg_range)):
-                ws.cell(row=r, column=2 + j).border = Border(
-                    left=Side(style="thin", color=MED_GRAY),
-                    right=Side(style="thin", color=MED_GRAY),
-                    top=Side(style="medium", color=DARK_BLUE),
-                    bottom=Side(style="medium", color=DARK_BLUE),
-                )
+        suffix = "_base" if i == base_idx else ""
+        for cell, style in zip(cells, styles):
+            ws.set_style(cell, style + suffix)
 
     # Legend
     lr = row + len(wacc_range) + 2
@@ -1493,88 +1764,35 @@ def build_sensitivity(wb, model_result, stock, financials):
     lr2 = lr + 6
     _write_section_header(ws, lr2, "REVENUE GROWTH vs OPERATING MARGIN SENSITIVITY", max_col)
 
-    base_metrics = model_result["metrics"]
-    base_growth = base_metrics["avg_revenue_growth"]
-    base_margin = base_metrics["avg_operating_margin"]
-    base_capex_pct = base_metrics["avg_capex_pct"]
-    base_da_pct = base_metrics["avg_da_pct"]
-    tax_rate = model_result["scenarios"]["base"]["projection"]["tax_rate"]
-
-    growth_range = [base_growth + d for d in [-0.04, -0.02, 0, 0.02, 0.04, 0.06]]
-    margin_range = [base_margin + d for d in [-0.04, -0.02, 0, 0.02, 0.04]]
-
     hr = lr2 + 1
-    ws.cell(row=hr, column=1, value="Growth \\ Margin").font = HEADER_FONT
-    ws.cell(row=hr, column=1).fill = HEADER_FILL
-    ws.cell(row=hr, column=1).alignment = CENTER
-    ws.cell(row=hr, column=1).border = THIN_BORDER
-    for j, mg in enumerate(margin_range):
-        cell = ws.cell(row=hr, column=2 + j, value=mg)
-        cell.font = HEADER_FONT
-        cell.fill = HEADER_FILL
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
+    _, *margin_cells = _write_header_row(ws, hr, ["Growth \\ Margin", *margin_range])
+    for cell in margin_cells:
         cell.number_format = FMT_PCT
 
-    base_rev = financials["revenue"][0]
-
-    for i, gr in enumerate(growth_range):
+    for i, (gr, prices, styles) in enumerate(zip(growth_range, tables["growth_margin"].tolist(),
+                                                 tables["growth_margin_styles"])):
         r = hr + 1 + i
-        cell = ws.cell(row=r, column=1, value=gr)
-        cell.font = BOLD_VALUE
-        cell.alignment = CENTER
-        cell.border = THIN_BORDER
-        cell.number_format = FMT_PCT
+        label_cell, *cells = ws.write_row(r, [gr, *prices])
+        ws.set_style(label_cell, "dcf_grid_axis_pct")
+        for cell, style in zip(cells, styles):
+            ws.set_style(cell, style)
 
-        for j, mg in enumerate(margin_range):
-            proj_fcfs = []
-            for yr in range(1, n_proj + 1):
-                fade = 1 - (yr - 1) / (n_proj * 2)
-                g = gr * fade
-                rev = base_rev * (1 + g) ** yr
-                ebit = rev * max(mg, 0.01)
-                nopat = ebit * (1 - tax_rate)
-                da = rev * base_da_pct
-                capex = rev * base_capex_pct
-                fcf = nopat + da - capex
-                proj_fcfs.append(fcf)
-
-            w = base_wacc
-            new_pv = sum(fcf / (1 + w) ** (k + 1) for k, fcf in enumerate(proj_fcfs))
-            tf = proj_fcfs[-1] * (1 + base_tg)
-            tv = tf / (w - base_tg) if w > base_tg else 0
-            pvt = tv / (1 + w) ** n_proj
-            ev = new_pv + pvt
-            eq = ev - net_debt
-            price = eq / shares if shares > 0 else 0
-
-            cell = ws.cell(row=r, column=2 + j, value=price)
-            cell.number_format = FMT_PRICE
-            cell.alignment = CENTER
-            cell.border = THIN_BORDER
-
-            if price > stock["current_price"] * 1.1:
-                cell.fill = GREEN_FILL
-                cell.font = GREEN_FONT
-            elif price < stock["current_price"] * 0.9:
-                cell.fill = RED_FILL
-                cell.font = RED_FONT
+    if not charts:
+        ws.flush()
+        return
 
     # ===== CHARTS for Sensitivity =====
     sens_chart_row = hr + len(growth_range) + 3
     scd = sens_chart_row + 32  # data area
+    chart_prices = np.nan_to_num(wacc_tg, nan=0.0)  # "N/A" cells chart as 0
 
     # -- Chart: Impact of WACC on Implied Price (line) --
-    ws.cell(row=scd, column=1, value="WACC")
-    ws.cell(row=scd + 1, column=1, value="Implied Price ($)")
-    mid_tg_idx = len(tg_range) // 2  # use middle terminal growth
-    for i, wacc in enumerate(wacc_range):
-        ws.cell(row=scd, column=2 + i, value=f"{wacc:.1%}")
-        # get the price from the sensitivity table
-        r = 5 + i  # row where the data was written
-        c = 2 + mid_tg_idx
-        cell_val = ws.cell(row=r, column=c).value
-        ws.cell(row=scd + 1, column=2 + i, value=cell_val if isinstance(cell_val, (int, float)) else 0)
+    # Prices along the middle terminal growth column
+    mid_tg_idx = len(tg_range) // 2
+    _write_table(ws, scd, [
+        ["WACC", *(f"{wacc:.1%}" for wacc in wacc_range)],
+        ["Implied Price ($)", *chart_prices[:, mid_tg_idx].tolist()],
+    ])
 
     chart_wacc_sens = _make_line_chart(
         ws, "Impact of WACC on Implied Share Price", "Implied Price ($)",
@@ -1583,15 +1801,10 @@ def build_sensitivity(wb, model_result, stock, financials):
         f"A{sens_chart_row}", width=28, height=14)
 
     # -- Chart: Impact of Terminal Growth on Implied Price (line) --
-    ws.cell(row=scd + 3, column=1, value="Terminal Growth")
-    ws.cell(row=scd + 4, column=1, value="Implied Price ($)")
-    mid_wacc_idx = len(wacc_range) // 2  # use middle WACC (base)
-    for j, tg in enumerate(tg_range):
-        ws.cell(row=scd + 3, column=2 + j, value=f"{tg:.2%}")
-        r = 5 + mid_wacc_idx
-        c = 2 + j
-        cell_val = ws.cell(row=r, column=c).value
-        ws.cell(row=scd + 4, column=2 + j, value=cell_val if isinstance(cell_val, (int, float)) else 0)
+    _write_table(ws, scd + 3, [
+        ["Terminal Growth", *(f"{tg:.2%}" for tg in tg_range)],
+        ["Implied Price ($)", *chart_prices[base_idx].tolist()],
+    ])
 
     _make_line_chart(
         ws, "Impact of Terminal Growth on Implied Share Price", "Implied Price ($)",
@@ -1599,6 +1812,8 @@ def build_sensitivity(wb, model_result, stock, financials):
         ["Implied Price at Base WACC"],
         f"A{sens_chart_row + 15}", width=28, height=14)
 
+    ws.flush()
+
 
 # ============================================================================
 # MAIN BUILDER
@@ -1606,7 +1821,7 @@ def build_sensitivity(wb, model_result, stock, financials):
 
 def build_instructions_sheet(wb, stock):
     """Sheet 13: How to use this workbook and change tickers."""
-    ws = wb.create_sheet(title="Instructions")
+    ws = _new_sheet(wb, "Instructions")
     ws.sheet_properties.tabColor = "37474F"
     max_col = 8
 
@@ -1652,7 +1867,7 @@ def build_instructions_sheet(wb, stock):
         ws.cell(row=r, column=3, value=key_info).font = LABEL_FONT
         ws.cell(row=r, column=4, value=data).font = LABEL_FONT
         ws.merge_cells(start_row=r, start_column=4, end_row=r, end_column=5)
-        ws.cell(row=r, column=6, value=cmd).font = Font(name="Consolas", size=9, color=MED_BLUE)
+        ws.cell(row=r, column=6, value=cmd).font = CODE_FONT
         ws.merge_cells(start_row=r, start_column=6, end_row=r, end_column=max_col)
         for c in range(2, max_col + 1):
             ws.cell(row=r, column=c).border = THIN_BORDER
@@ -1678,7 +1893,7 @@ def build_instructions_sheet(wb, stock):
         ws.cell(row=r, column=3, value=desc).font = LABEL_FONT
         ws.merge_cells(start_row=r, start_column=3, end_row=r, end_column=max_col)
         ws.cell(row=r, column=3).alignment = WRAP
-        ws.row_dimensions[r].height = 36
+        ws.set_height(r, 36)
 
     row = 25
     _write_section_header(ws, row, "WORKBOOK SHEETS GUIDE", max_col)
@@ -1711,55 +1926,71 @@ def build_instructions_sheet(wb, stock):
         ("python generate_dcf.py AAPL --av-key KEY", "Use Alpha Vantage as data fallback"),
         ("python generate_dcf.py AAPL --fred-key KEY", "Use FRED for interest rate data"),
         ("python generate_dcf.py AAPL --sample", "Use built-in sample data (offline mode)"),
+        ("python generate_dcf.py AAPL --no-charts", "Numbers only: skip all charts (faster)"),
     ]
     r = row + 1
     _write_header_row(ws, r, ["", "Command", "Description", "", "", "", "", ""])
     for i, (cmd, desc) in enumerate(cmds):
         r = row + 2 + i
-        ws.cell(row=r, column=2, value=cmd).font = Font(name="Consolas", size=9, color=MED_BLUE)
+        ws.cell(row=r, column=2, value=cmd).font = CODE_FONT
         ws.cell(row=r, column=3, value=desc).font = LABEL_FONT
         ws.merge_cells(start_row=r, start_column=3, end_row=r, end_column=max_col)
         for c in range(2, max_col + 1):
             ws.cell(row=r, column=c).border = THIN_BORDER
 
-    row = 46
+    row = 47
     _write_section_header(ws, row, "REQUIREMENTS", max_col)
     r = row + 1
     ws.cell(row=r, column=2, value="Install:").font = BOLD_VALUE
-    ws.cell(row=r, column=3, value="pip install -r requirements.txt").font = Font(name="Consolas", size=10, color=MED_BLUE)
+    ws.cell(row=r, column=3, value="pip install -r requirements.txt").font = CODE_FONT_LARGE
     r = row + 2
     ws.cell(row=r, column=2, value="Packages:").font = BOLD_VALUE
-    ws.cell(row=r, column=3, value="yfinance, openpyxl, requests, pandas").font = LABEL_FONT
+    ws.cell(row=r, column=3, value="yfinance, openpyxl, requests, pandas, numpy, lxml (optional: numba)").font = LABEL_FONT
 
     r = row + 4
     ws.cell(row=r, column=2, value=f"Current Ticker:").font = BOLD_VALUE
     ws.cell(row=r, column=3, value=stock["ticker"]).font = BIG_NUMBER
 
+    ws.flush()
+
+
+def build_workbook(stock, financials, rates, model_result, data_source,
+                   charts=True, generated_at=None) -> Workbook:
+    """
+    Build the complete DCF workbook and return the Workbook object.
 
-def build_workbook(stock, financials, rates, model_result, data_source) -> Workbook:
-    """Build the complete DCF workbook and return the Workbook object."""
-    wb = Workbook()
+    The workbook is write-only: each sheet is streamed out as soon as its
+    builder finishes, so it can only be saved once.  charts=False leaves out
+    every chart together with the hidden data blocks that feed them.
+    *generated_at* overrides the dashboard's "Generated:" stamp, e.g. so a
+    batch of workbooks share one; by default it is the time of the call.
+    """
+    wb = Workbook(write_only=True)
+    for spec in NAMED_STYLES:
+        wb.add_named_style(NamedStyle(**spec))
 
     # Sheet 1: Dashboard
-    build_dashboard(wb, stock, financials, rates, model_result, data_source)
+    build_dashboard(wb, stock, financials, rates, model_result, data_source, charts,
+                    generated_at or _timestamp())
 
     # Sheet 2-4: Financial Statements
-    build_income_statement(wb, financials)
-    build_balance_sheet(wb, financials)
-    build_cash_flow(wb, financials)
+    build_income_statement(wb, financials, charts)
+    build_balance_sheet(wb, financials, charts)
+    build_cash_flow(wb, financials, charts)
 
     # Sheet 5: WACC
-    build_wacc_sheet(wb, model_result["wacc_data"], stock, financials, rates)
+    build_wacc_sheet(wb, model_result["wacc_data"], stock, financials, rates, charts)
 
     # Sheet 6-10: DCF Scenarios
+    template = _dcf_sheet_template(model_result, financials)
     for key in ["base", "bull", "bear", "rate_hike", "rate_cut"]:
-        build_dcf_scenario_sheet(wb, key, model_result, financials, stock)
+        build_dcf_scenario_sheet(wb, key, model_result, financials, stock, template, charts)
 
     # Sheet 11: Scenario Comparison
-    build_scenario_comparison(wb, model_result, stock, financials)
+    build_scenario_comparison(wb, model_result, stock, financials, charts)
 
     # Sheet 12: Sensitivity Analysis
-    build_sensitivity(wb, model_result, stock, financials)
+    build_sensitivity(wb, model_result, stock, financials, charts)
 
     # Sheet 13: Instructions
     build_instructions_sheet(wb, stock)
@@ -47,6 +47,8 @@ Examples:
   python generate_dcf.py GOOGL --fred-key YOUR_KEY    # FRED for rates
   python generate_dcf.py AMZN --av-key YOUR_KEY       # Alpha Vantage fallback
   python generate_dcf.py AAPL --sample                # Offline sample data
+  python generate_dcf.py AAPL --refresh               # Bypass the .cache/ data cache
+  python generate_dcf.py AAPL --no-charts             # Numbers only, no charts
 
 Data Sources (tried in order):
   1. Yahoo Finance (yfinance) — no API key needed
@@ -70,6 +72,10 @@ Data Sources (tried in order):
                         help="Equity Risk Premium (default: 0.055 = 5.5%%)")
     parser.add_argument("--sample", action="store_true",
                         help="Force use of sample data (no API calls)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached data in .cache/ and re-download everything")
+    parser.add_argument("--no-charts", action="store_true",
+                        help="Leave charts out of the workbook (numbers only, faster to build)")
 
     args = parser.parse_args()
     ticker = args.ticker.upper().strip()
@@ -84,7 +90,8 @@ Data Sources (tried in order):
     # Step 1: Fetch data
     print("[1/4] Fetching financial data...")
     data = fetch_all(ticker, fred_api_key=args.fred_key,
-                     alpha_vantage_key=args.av_key, force_sample=args.sample)
+                     alpha_vantage_key=args.av_key, force_sample=args.sample,
+                     force_refresh=args.refresh)
     stock = data["stock"]
     financials = data["financials"]
     rates = data["rates"]
@@ -111,7 +118,8 @@ Data Sources (tried in order):
 
     # Step 3: Build Excel
     print("\n[3/4] Building Excel workbook (13 sheets)...")
-    wb = build_workbook(stock, financials, rates, model_result, source)
+    wb = build_workbook(stock, financials, rates, model_result, source,
+                        charts=not args.no_charts)
 
     # Step 4: Save
     print(f"\n[4/4] Saving to {output}...")
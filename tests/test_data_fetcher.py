@@ -0,0 +1,130 @@
+"""
+Offline tests for data_fetcher's Yahoo Finance fallbacks.
+
+Run with:  python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_fetcher  # noqa: E402
+from dcf_engine import SCENARIOS, run_all_scenarios  # noqa: E402
+
+
+class EmptyTicker:
+    """yf.Ticker stand-in that answers like Yahoo under a rate limit."""
+
+    income_stmt = balance_sheet = cashflow = pd.DataFrame()
+    info = {}
+    fast_info = {}
+
+    def history(self, period):
+        return pd.DataFrame()
+
+
+class FallbackTest(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(data_fetcher, "HAS_YFINANCE", True),
+            mock.patch.object(data_fetcher, "_get_ticker", lambda symbol: EmptyTicker()),
+            mock.patch.object(data_fetcher, "_CACHE", data_fetcher.FileCache(tempfile.mkdtemp())),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_empty_statements_fall_back_to_sample(self):
+        data = data_fetcher.fetch_all("AAPL")
+        self.assertEqual(data["source"], "sample")
+        self.assertTrue(data["financials"]["revenue"])
+
+        result = run_all_scenarios(data["stock"], data["financials"], data["rates"])
+        self.assertEqual(len(result["scenarios"]), len(SCENARIOS))
+
+    def test_empty_statements_raise(self):
+        with self.assertRaises(ValueError):
+            data_fetcher.fetch_financials_live("AAPL", EmptyTicker())
+
+    def test_batch_lookup_failure_falls_back_per_ticker(self):
+        def _no_yfinance():
+            raise ImportError("yfinance unavailable")
+
+        with mock.patch.object(data_fetcher, "_yf", _no_yfinance):
+            data = data_fetcher.fetch_all_batch(["AAPL", "ZZZZ"])
+        self.assertEqual({t: d["source"] for t, d in data.items()},
+                         {"AAPL": "sample", "ZZZZ": "sample"})
+
+
+class TargetedInfoTest(unittest.TestCase):
+    """fetch_stock_data_live reads tk.info when the private quote scraper is unusable."""
+
+    INFO = {"shortName": "Apple Inc.", "currentPrice": 190.0, "beta": 1.2}
+
+    def _stock(self, tk):
+        tk.info = self.INFO
+        tk.fast_info = {}
+        return data_fetcher.fetch_stock_data_live("AAPL", tk)
+
+    def test_missing_quote_falls_back_to_info(self):
+        stock = self._stock(mock.Mock(spec=["info", "fast_info"]))
+        self.assertEqual(stock["company_name"], "Apple Inc.")
+        self.assertEqual(stock["current_price"], 190.0)
+
+    def test_changed_quote_signature_falls_back_to_info(self):
+        tk = mock.Mock(spec=["info", "fast_info", "_quote"])
+        tk._quote._fetch.side_effect = TypeError("unexpected argument")
+        self.assertEqual(self._stock(tk)["beta"], 1.2)
+
+
+class MissingYearsTest(unittest.TestCase):
+    """A partly reported oldest year is dropped, not zero-filled."""
+
+    YEARS = pd.to_datetime(["2024-09-30", "2023-09-30", "2022-09-30", "2021-09-30"])
+
+    def _ticker(self):
+        nan = float("nan")
+
+        def frame(rows):
+            return pd.DataFrame.from_dict(rows, orient="index", columns=self.YEARS)
+
+        tk = mock.Mock(spec=["income_stmt", "balance_sheet", "cashflow"])
+        tk.income_stmt = frame({
+            "Total Revenue": [120.0, 110.0, 100.0, nan],
+            "Operating Income": [36.0, 33.0, 30.0, nan],
+            "Net Income": [24.0, 22.0, 20.0, nan],
+        })
+        tk.balance_sheet = frame({"Total Debt": [50.0, 50.0, 50.0, nan]})
+        tk.cashflow = frame({
+            "Operating Cash Flow": [30.0, 28.0, 25.0, nan],
+            "Capital Expenditure": [-5.0, -5.0, -5.0, nan],
+        })
+        return tk
+
+    def test_trailing_nan_year_is_dropped(self):
+        fin = data_fetcher.fetch_financials_live("AAPL", self._ticker(), concurrent=False)
+        self.assertEqual(fin["years"], ["2024", "2023", "2022"])
+        self.assertEqual(fin["revenue"], [120.0, 110.0, 100.0])
+        self.assertEqual(fin["free_cash_flow"], [25.0, 23.0, 20.0])
+
+    def test_zero_revenue_year_is_kept_out_of_averages(self):
+        from dcf_engine import compute_historical_metrics
+        fin = dict(data_fetcher.SAMPLE_DATA["AAPL"]["financials"])
+        clean = compute_historical_metrics(fin)
+        fin = {k: [*v, 0.0] if isinstance(v, list) and k != "years" else v
+               for k, v in fin.items()}
+        padded = compute_historical_metrics(fin)
+        for key in ("avg_revenue_growth", "avg_operating_margin", "avg_fcf_margin",
+                    "avg_capex_pct", "avg_da_pct"):
+            self.assertAlmostEqual(padded[key], clean[key], msg=key)
+
+
+if __name__ == "__main__":
+    unittest.main()